@@ -18,7 +18,15 @@ from imap_data_access.file_validation import (
     ScienceFilePath,
     SPICEFilePath,
 )
-from imap_data_access.io import download, query, reprocess, upload
+from imap_data_access.io import (
+    bulk_download,
+    bulk_upload,
+    clear_query_cache,
+    download,
+    query,
+    reprocess,
+    upload,
+)
 from imap_data_access.processing_input import (
     AncillaryInput,
     ProcessingInputCollection,
@@ -44,6 +52,9 @@ __all__ = [
     "ScienceFilePath",
     "ScienceInput",
     "SpinInput",
+    "bulk_download",
+    "bulk_upload",
+    "clear_query_cache",
     "download",
     "query",
     "reprocess",
@@ -61,6 +72,7 @@ config = {
     # Create a base64 encoded string for the username and password
     # echo -n 'username:password' | base64
     "WEBPODA_TOKEN": os.getenv("IMAP_WEBPODA_TOKEN"),
+    "VERIFY_HASHES": os.getenv("IMAP_VERIFY_HASHES", "").lower() in ("1", "true"),
 }
 """Settings configuration dictionary.
 
@@ -76,49 +88,60 @@ WEBPODA_TOKEN : This is the token used to authenticate with the webpoda API.
     It can be set on the command line using the --webpoda-token option, or through
     the environment variable IMAP_WEBPODA_TOKEN. It is only necessary for downloading
     packet data.
+VERIFY_HASHES : Whether to check files that were already downloaded against the
+    SHA-256 hash stored when they were downloaded, and download them again if they
+    don't match. It can be enabled by setting the environment variable
+    IMAP_VERIFY_HASHES to 1. It is disabled by default since it means reading every
+    file again.
 """
 
 
 # NOTE: ialirt and spacecraft aren't actual instruments, but they are
 #       additional data sources for packet definitions and processing
-VALID_INSTRUMENTS = {
-    "codice",
-    "glows",
-    "hit",
-    "hi",
-    "ialirt",
-    "idex",
-    "lo",
-    "mag",
-    "spacecraft",
-    "swapi",
-    "swe",
-    "ultra",
-}
+VALID_INSTRUMENTS = frozenset(
+    {
+        "codice",
+        "glows",
+        "hit",
+        "hi",
+        "ialirt",
+        "idex",
+        "lo",
+        "mag",
+        "spacecraft",
+        "swapi",
+        "swe",
+        "ultra",
+    }
+)
 
-VALID_DATALEVELS = {
-    "l0",
-    "l1",
-    "l1a",
-    "l1b",
-    "l1c",
-    "l1ca",
-    "l1cb",
-    "l1d",
-    "l2",
-    "l2a",
-    "l2b",
-    "l2c",
-    "l3",
-    "l3a",
-    "l3b",
-    "l3c",
-    "l3d",
-    "l3e",
-}
+VALID_DATALEVELS = frozenset(
+    {
+        "l0",
+        "l1",
+        "l1a",
+        "l1b",
+        "l1c",
+        "l1ca",
+        "l1cb",
+        "l1d",
+        "l2",
+        "l2a",
+        "l2b",
+        "l2c",
+        "l3",
+        "l3a",
+        "l3b",
+        "l3c",
+        "l3d",
+        "l3e",
+    }
+)
 
-VALID_TABLES = {
-    "science",
-    "ancillary",
-    "spice",
-}
+VALID_TABLES = frozenset(
+    {
+        "science",
+        "ancillary",
+        "spice",
+    }
+)
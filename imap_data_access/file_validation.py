@@ -3,15 +3,261 @@
 
 from __future__ import annotations
 
+import functools
+import os
 import re
 import typing
 import warnings
 from abc import abstractmethod
+from collections.abc import Iterable
 from datetime import datetime
 from pathlib import Path
 
 import imap_data_access
 
+# Filename patterns are compiled once at import time since they are matched for
+# every file path object that gets created.
+_SCIENCE_RE = re.compile(
+    r"^(?P<mission>imap)_"
+    r"(?P<instrument>[^_]+)_"
+    r"(?P<data_level>[^_]+)_"
+    r"(?P<descriptor>[^_]+)_"
+    r"(?P<start_date>\d{8})"
+    # Optional repointing/CR field
+    r"(-(?P<interval_type>(?:repoint|cr))(?P<interval>\d{5}))?"
+    r"_(?P<version>v\d{3})"
+    r"\.(?P<extension>[^.]+)$"
+)
+
+# Days per month in a non-leap year, used for validating YYYYMMDD dates
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Order of the components returned by the cached filename parsers below
+_SCIENCE_COMPONENTS = (
+    "mission",
+    "instrument",
+    "data_level",
+    "descriptor",
+    "start_date",
+    "repointing",
+    "cr",
+    "version",
+    "extension",
+)
+_ANCILLARY_COMPONENTS = (
+    "mission",
+    "instrument",
+    "descriptor",
+    "start_date",
+    "end_date",
+    "version",
+    "extension",
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_science_filename(filename: str) -> tuple | None:
+    """Split a science filename into its components.
+
+    The result is cached because the same filenames tend to get parsed many times
+    over (e.g. while guessing the file type and again when creating the object).
+
+    Parameters
+    ----------
+    filename : str
+        The filename, without any directories.
+
+    Returns
+    -------
+    tuple or None
+        The filename components ordered like ``_SCIENCE_COMPONENTS``, or None if
+        the filename doesn't match.
+    """
+    match = _SCIENCE_RE.match(filename)
+    if match is None:
+        return None
+    return _science_match_components(match)
+
+
+def _science_match_components(match: re.Match) -> tuple:
+    """Convert a ``_SCIENCE_RE`` match into the science filename components.
+
+    Parameters
+    ----------
+    match : re.Match
+        Successful match of ``_SCIENCE_RE`` against a filename.
+
+    Returns
+    -------
+    tuple
+        The filename components ordered like ``_SCIENCE_COMPONENTS``.
+    """
+    # If the repointing field exists, we want to check if it's a repointing or
+    # carrington rotation (cr) and set the field accordingly
+    repointing = None
+    cr = None
+    interval_number = match["interval"]
+    if interval_number:
+        # We want the repointing number as an integer
+        interval_number = int(interval_number)
+        if match["interval_type"] == "cr":
+            cr = interval_number
+        elif match["interval_type"] == "repoint":
+            repointing = interval_number
+
+    return (
+        match["mission"],
+        match["instrument"],
+        match["data_level"],
+        match["descriptor"],
+        match["start_date"],
+        repointing,
+        cr,
+        match["version"],
+        match["extension"],
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_ancillary_filename(filename: str) -> tuple | None:
+    """Split an ancillary filename into its components.
+
+    Parameters
+    ----------
+    filename : str
+        The filename, without any directories.
+
+    Returns
+    -------
+    tuple or None
+        The filename components ordered like ``_ANCILLARY_COMPONENTS``, or None if
+        the filename doesn't match.
+    """
+    match = _ANCILLARY_RE.match(filename)
+    if match is None:
+        return None
+    return match.group(*_ANCILLARY_COMPONENTS)
+
+
+@functools.lru_cache(maxsize=8)
+def _strict_science_regex(
+    valid_instruments: frozenset[str], valid_datalevels: frozenset[str]
+) -> re.Pattern:
+    """Return a science filename pattern that only matches valid field values.
+
+    Unlike ``_SCIENCE_RE``, the instrument and data level are restricted to the
+    valid values. The pattern is cached for each set of valid values, so it is
+    compiled again if the package level valid values are changed.
+
+    Parameters
+    ----------
+    valid_instruments : frozenset of str
+        The valid instrument names.
+    valid_datalevels : frozenset of str
+        The valid data levels.
+
+    Returns
+    -------
+    re.Pattern
+        The compiled pattern.
+    """
+    instruments = "|".join(map(re.escape, sorted(valid_instruments)))
+    data_levels = "|".join(map(re.escape, sorted(valid_datalevels)))
+    return re.compile(
+        r"^imap_"
+        rf"(?:{instruments})_"
+        rf"(?:{data_levels})_"
+        r"[^_]+_"
+        r"\d{8}"
+        r"(?:-(?:repoint|cr)\d{5})?"
+        r"_v\d{3}"
+        r"\.[^.]+$"
+    )
+
+
+def _is_valid_yyyymmdd(date: str) -> bool:
+    """Check that a string is a real date in the YYYYMMDD format.
+
+    The fixed layout is checked by hand rather than with strptime, which is slow
+    and more lenient about the format (e.g. unpadded months).
+
+    Parameters
+    ----------
+    date : str
+        Date to check.
+
+    Returns
+    -------
+    bool
+        Whether the date is valid or not.
+    """
+    if len(date) != 8 or not (date.isascii() and date.isdigit()):
+        return False
+    year = int(date[0:4])
+    month = int(date[4:6])
+    day = int(date[6:8])
+    if year < 1 or not 1 <= month <= 12:
+        return False
+    days_in_month = _DAYS_IN_MONTH[month - 1]
+    if month == 2 and year & 3 == 0 and (year % 100 != 0 or year % 400 == 0):
+        days_in_month += 1
+    return 1 <= day <= days_in_month
+
+
+def _parse_yyyymmdd(date: str) -> datetime:
+    """Convert a string in the YYYYMMDD format to a datetime.
+
+    This is a faster replacement for ``datetime.strptime(date, "%Y%m%d")``, which
+    has to interpret the format string on every call.
+
+    Parameters
+    ----------
+    date : str
+        Date in YYYYMMDD format.
+
+    Returns
+    -------
+    datetime
+        The date at midnight.
+
+    Raises
+    ------
+    ValueError
+        If the string isn't a valid date in the YYYYMMDD format.
+    """
+    if len(date) != 8 or not (date.isascii() and date.isdigit()):
+        raise ValueError(f"time data {date!r} does not match format '%Y%m%d'")
+    return datetime(int(date[0:4]), int(date[4:6]), int(date[6:8]))
+
+
+def _is_prefixed_number(value: str, prefix: str, n_digits: int) -> bool:
+    """Check that a string is a prefix followed by a fixed number of digits.
+
+    This covers the simple fields like versions ("v001") and repointings
+    ("repoint00001"), where string methods are cheaper than a regex.
+
+    Parameters
+    ----------
+    value : str
+        The string to check.
+    prefix : str
+        The expected prefix.
+    n_digits : int
+        The expected number of digits after the prefix.
+
+    Returns
+    -------
+    bool
+        Whether the string matches or not.
+    """
+    digits = value[len(prefix) :]
+    return (
+        value.startswith(prefix)
+        and len(digits) == n_digits
+        and digits.isascii()
+        and digits.isdigit()
+    )
+
 
 def generate_imap_file_path(filename: str) -> ImapFilePath:
     """Generate an ImapFilePath object from a filename.
@@ -28,6 +274,15 @@ def generate_imap_file_path(filename: str) -> ImapFilePath:
     -------
     A FilePath object
     """
+    # Try the most likely class first so the common case doesn't have to go
+    # through several failed constructors, then fall back to trying them all.
+    likely_cls = _guess_file_class(_basename(filename))
+    if likely_cls is not None:
+        try:
+            return likely_cls(filename)
+        except ImapFilePath.InvalidImapFileError:
+            pass
+
     for cls in (
         ScienceFilePath,
         AncillaryFilePath,
@@ -35,6 +290,8 @@ def generate_imap_file_path(filename: str) -> ImapFilePath:
         QuicklookFilePath,
         DependencyFilePath,
     ):
+        if cls is likely_cls:
+            continue
         try:
             return cls(filename)
         except ImapFilePath.InvalidImapFileError:
@@ -44,6 +301,86 @@ def generate_imap_file_path(filename: str) -> ImapFilePath:
     )
 
 
+def parse_science_batch(filenames: Iterable[str | Path]) -> dict[str, list]:
+    """Split many science filenames into their components at once.
+
+    This is meant for large listings of files (e.g. a directory or query result)
+    where creating a ``ScienceFilePath`` for every file is too slow. The results
+    are column oriented: one list per component, in the same order as the input.
+    Only the naming convention is checked, the component values are not validated.
+
+    Filenames that don't match the science naming convention have None in every
+    column, so the columns always stay aligned with the input.
+
+    Parameters
+    ----------
+    filenames : Iterable[str | Path]
+        The filenames or file paths to parse.
+
+    Returns
+    -------
+    dict[str, list]
+        Mapping from component name (e.g. "instrument", "start_date") to the list
+        of values for that component.
+    """
+    columns = {component: [] for component in _SCIENCE_COMPONENTS}
+    appends = tuple(column.append for column in columns.values())
+    empty_row = (None,) * len(appends)
+    match = _SCIENCE_RE.match
+    for filename in filenames:
+        result = match(_basename(filename))
+        row = empty_row if result is None else _science_match_components(result)
+        for append, value in zip(appends, row):
+            append(value)
+    return columns
+
+
+def _basename(filename: str | Path) -> str:
+    """Return the final component of a file path without creating a Path.
+
+    Parameters
+    ----------
+    filename : str or Path
+        The filename or file path.
+
+    Returns
+    -------
+    str
+        The filename, without any directories.
+    """
+    if isinstance(filename, Path):
+        return filename.name
+    return os.path.basename(filename)
+
+
+def _guess_file_class(filename: str) -> type[ImapFilePath] | None:
+    """Guess the file path class from the filename pattern and extension.
+
+    This is only a cheap pre-classification, the returned class still needs to
+    validate the filename. A class is only guessed when none of the classes tried
+    before it by ``generate_imap_file_path`` can accept the filename, so trying it
+    first gives the same result.
+
+    Parameters
+    ----------
+    filename : str
+        The filename, without any directories.
+
+    Returns
+    -------
+    type[ImapFilePath] or None
+        The file path class that most likely matches the filename, or None if the
+        classes have to be tried in order.
+    """
+    match = _SCIENCE_RE.match(filename)
+    if match is not None and match["extension"] in ScienceFilePath.VALID_EXTENSIONS:
+        return ScienceFilePath
+    # Science files are tried first, but can't have this name
+    if _ANCILLARY_RE.match(filename) is not None:
+        return AncillaryFilePath
+    return None
+
+
 class ImapFilePath:
     """Base class for FilePaths.
 
@@ -51,6 +388,10 @@ class ImapFilePath:
     AncillaryFilePath, and SPICEFilePath.
     """
 
+    # Subclasses declare their attributes in __slots__ to keep the instances small,
+    # there can be a lot of them when working through a whole archive listing
+    __slots__ = ()
+
     class InvalidImapFileError(Exception):
         """Indicates a bad file type."""
 
@@ -70,6 +411,20 @@ class ImapFilePath:
         )
         return imap_data_access.config["DATA_DIR"]
 
+    @property
+    def filename(self) -> Path:
+        """Return the path of the file this object was created from."""
+        # Most objects are created from plain filename strings, so the Path is
+        # only built once something asks for it
+        if not isinstance(self._filename, Path):
+            self._filename = Path(self._filename)
+        return self._filename
+
+    @filename.setter
+    def filename(self, filename: str | Path) -> None:
+        """Set the path of the file this object refers to."""
+        self._filename = filename
+
     @staticmethod
     def is_valid_date(input_date: str) -> bool:
         """Check input date string is in valid format and is correct date.
@@ -84,14 +439,7 @@ class ImapFilePath:
         bool
             Whether date input is valid or not
         """
-        # Validate if it's a real date
-        try:
-            # This checks if date is in YYYYMMDD format.
-            # Sometimes, date is correct but not in the format we want
-            datetime.strptime(input_date, "%Y%m%d")
-            return True
-        except ValueError:
-            return False
+        return _is_valid_yyyymmdd(input_date)
 
     @staticmethod
     def is_valid_version(input_version: str) -> bool:
@@ -107,7 +455,20 @@ class ImapFilePath:
         bool
             Whether input version is valid or not.
         """
-        return input_version == "latest" or re.fullmatch(r"v\d{3}", input_version)
+        return input_version == "latest" or _is_prefixed_number(input_version, "v", 3)
+
+    @property
+    def archive_relative_path(self) -> str:
+        """Return the path of the file within the data archive.
+
+        This is the path returned by ``construct_path`` relative to the data
+        directory, always using forward slashes, as used in the download URLs.
+        """
+        return (
+            self.construct_path()
+            .relative_to(imap_data_access.config["DATA_DIR"])
+            .as_posix()
+        )
 
     @abstractmethod
     def construct_path(self) -> Path:
@@ -115,7 +476,7 @@ class ImapFilePath:
         raise NotImplementedError
 
     @abstractmethod
-    def is_valid_for_start_date(self, start_date):
+    def is_valid_for_start_date(self, start_date: datetime) -> bool:
         """Check if the file is valid for the given time."""
         pass
 
@@ -129,13 +490,26 @@ class ScienceFilePath(ImapFilePath):
     )
     VALID_EXTENSIONS: typing.ClassVar[set[str]] = {"cdf", "pkts"}
     _dir_prefix = "imap"
+    __slots__ = (
+        "_filename",
+        "cr",
+        "data_level",
+        "descriptor",
+        "error_message",
+        "extension",
+        "instrument",
+        "mission",
+        "repointing",
+        "start_date",
+        "version",
+    )
 
     class InvalidScienceFileError(ImapFilePath.InvalidImapFileError):
         """DEPRECATED: Use ImapFilePath.InvalidImapFileError instead."""
 
         pass
 
-    def __init__(self, filename: str | Path):
+    def __init__(self, filename: str | Path) -> None:
         """Class to store filepath and file management methods for science files.
 
         If you have an instance of this class, you can be confident you have a valid
@@ -164,25 +538,87 @@ class ScienceFilePath(ImapFilePath):
         filename : str | Path
             Science data filename or file path.
         """
-        self.filename = Path(filename)
+        self._filename = filename
+        basename = _basename(filename)
 
         try:
-            split_filename = self.extract_filename_components(self.filename)
+            split_filename = self.extract_filename_components(basename)
         except ValueError as err:
             raise self.InvalidImapFileError(
                 f"Invalid filename. Expected file to match format: "
                 f"{ScienceFilePath.FILENAME_CONVENTION}"
             ) from err
 
-        self.mission = split_filename["mission"]
-        self.instrument = split_filename["instrument"]
-        self.data_level = split_filename["data_level"]
-        self.descriptor = split_filename["descriptor"]
-        self.start_date = split_filename["start_date"]
-        self.repointing = split_filename["repointing"]
-        self.cr = split_filename["cr"]
-        self.version = split_filename["version"]
-        self.extension = split_filename["extension"]
+        matches_strict = (
+            _strict_science_regex(
+                frozenset(imap_data_access.VALID_INSTRUMENTS),
+                frozenset(imap_data_access.VALID_DATALEVELS),
+            ).match(basename)
+            is not None
+        )
+        self._set_components(**split_filename, matches_strict=matches_strict)
+
+    @classmethod
+    def _from_components(cls, filename: str | Path, **components) -> ScienceFilePath:
+        """Create an instance from a filename and its already known components.
+
+        This skips parsing the filename, so it should only be used when the
+        filename was built from the same components.
+
+        Parameters
+        ----------
+        filename : str | Path
+            Science data filename or file path.
+        **components
+            The filename components, as returned by extract_filename_components.
+
+        Returns
+        -------
+        ScienceFilePath
+            The validated file path object.
+        """
+        file_path = cls.__new__(cls)
+        file_path._filename = filename
+        file_path._set_components(**components)
+        return file_path
+
+    def _set_components(
+        self,
+        mission: str,
+        instrument: str,
+        data_level: str,
+        descriptor: str,
+        start_date: str,
+        repointing: int | None,
+        cr: int | None,
+        version: str,
+        extension: str,
+        matches_strict: bool = False,
+    ) -> None:
+        """Set the filename components and validate them.
+
+        ``matches_strict`` tells that the filename these components were just parsed
+        from matches the strict science pattern, which already guarantees the
+        mission, instrument, data level and version. Only the checks a regex can't
+        do are left in that case.
+        """
+        self.mission = mission
+        self.instrument = instrument
+        self.data_level = data_level
+        self.descriptor = descriptor
+        self.start_date = start_date
+        self.repointing = repointing
+        self.cr = cr
+        self.version = version
+        self.extension = extension
+
+        if (
+            matches_strict
+            and _is_valid_yyyymmdd(start_date)
+            and extension in self.VALID_EXTENSIONS
+        ):
+            self.error_message = ""
+            return
 
         self.error_message = self.validate_filename()
         if self.error_message:
@@ -240,22 +676,40 @@ class ScienceFilePath(ImapFilePath):
         if data_level == "l0":
             extension = "pkts"
         time_field = start_time
+        repointing_number = None
         if repointing is not None:
             if ScienceFilePath.is_valid_repointing(repointing):
                 time_field += f"-{repointing}"
+                repointing_number = int(repointing[-5:])
             elif isinstance(repointing, int):
                 time_field += f"-repoint{repointing:05d}"
+                repointing_number = repointing
             if cr:
                 raise ImapFilePath.InvalidImapFileError(
                     "Only one of CR or repointing can be included."
                 )
         if cr:
             time_field += f"-cr{cr:05d}"
+        else:
+            cr = None
         filename = (
             f"imap_{instrument}_{data_level}_{descriptor}_{time_field}_"
             f"{version}.{extension}"
         )
-        return cls(filename)
+        # We already have all of the components, so there's no need to parse them
+        # back out of the filename
+        return cls._from_components(
+            filename,
+            mission="imap",
+            instrument=instrument,
+            data_level=data_level,
+            descriptor=descriptor,
+            start_date=start_time,
+            repointing=repointing_number,
+            cr=cr,
+            version=version,
+            extension=extension,
+        )
 
     def validate_filename(self) -> str:
         """Validate the filename and populate the error message for wrong attributes.
@@ -271,19 +725,23 @@ class ScienceFilePath(ImapFilePath):
         """
         error_message = ""
 
-        if any(
-            attr is None or attr == ""
-            for attr in [
-                self.mission,
-                self.instrument,
-                self.data_level,
-                self.descriptor,
-                self.start_date,
-                self.version,
-                self.extension,
-            ]
-        ):
+        if _SCIENCE_RE.match(_basename(self._filename)) is None:
             error_message = (
+                f"Invalid filename. Expected file to match format: "
+                f"{ScienceFilePath.FILENAME_CONVENTION} \n"
+            )
+
+        # Missing attributes are either None or empty strings
+        if not (
+            self.mission
+            and self.instrument
+            and self.data_level
+            and self.descriptor
+            and self.start_date
+            and self.version
+            and self.extension
+        ):
+            error_message += (
                 f"Invalid filename, missing attribute. Filename "
                 f"convention is {ScienceFilePath.FILENAME_CONVENTION} \n"
             )
@@ -294,17 +752,17 @@ class ScienceFilePath(ImapFilePath):
             error_message += (
                 f"Invalid instrument {self.instrument}. Please choose "
                 f"from "
-                f"{imap_data_access.VALID_INSTRUMENTS} \n"
+                f"{set(imap_data_access.VALID_INSTRUMENTS)} \n"
             )
         if self.data_level not in imap_data_access.VALID_DATALEVELS:
             error_message += (
                 f"Invalid data level {self.data_level}. Please choose "
                 f"from "
-                f"{imap_data_access.VALID_DATALEVELS} \n"
+                f"{set(imap_data_access.VALID_DATALEVELS)} \n"
             )
-        if not self.is_valid_date(self.start_date):
+        if not _is_valid_yyyymmdd(self.start_date):
             error_message += "Invalid start date format. Please use YYYYMMDD format. \n"
-        if not bool(re.match(r"^v\d{3}$", self.version)):
+        if not _is_prefixed_number(self.version, "v", 3):
             error_message += "Invalid version format. Please use vXXX format. \n"
         if self.repointing and not isinstance(self.repointing, int):
             error_message += "The repointing number should be an integer.\n"
@@ -330,12 +788,34 @@ class ScienceFilePath(ImapFilePath):
         Path
             Upload path
         """
-        upload_path = Path(
-            f"{self._dir_prefix}/{self.instrument}/{self.data_level}/"
-            f"{self.start_date[:4]}/{self.start_date[4:6]}/{self.filename}"
-        )
+        return Path(imap_data_access.config["DATA_DIR"], *self._archive_parts())
+
+    @property
+    def archive_relative_path(self) -> str:
+        """Return the path of the file within the data archive.
+
+        expected return:
+        mission/instrument/data_level/startdate_month/startdate_day/filename
+        """
+        # Built directly from the components, it doesn't depend on the data directory
+        return "/".join(self._archive_parts())
 
-        return imap_data_access.config["DATA_DIR"] / upload_path
+    def _archive_parts(self) -> tuple[str, ...]:
+        """Return the parts of the path of the file within the data archive.
+
+        Returns
+        -------
+        tuple of str
+            The directories and the filename, in order.
+        """
+        return (
+            self._dir_prefix,
+            self.instrument,
+            self.data_level,
+            self.start_date[:4],
+            self.start_date[4:6],
+            _basename(self._filename),
+        )
 
     @staticmethod
     def extract_filename_components(filename: str | Path) -> dict:
@@ -360,45 +840,17 @@ class ScienceFilePath(ImapFilePath):
         components : dict
             Dictionary containing components.
         """
-        pattern = (
-            r"^(?P<mission>imap)_"
-            r"(?P<instrument>[^_]+)_"
-            r"(?P<data_level>[^_]+)_"
-            r"(?P<descriptor>[^_]+)_"
-            r"(?P<start_date>\d{8})"
-            # Optional repointing/CR field
-            r"(-(?P<interval_type>(?:repoint|cr))(?P<interval>\d{5}))?"
-            r"_(?P<version>v\d{3})"
-            r"\.(?P<extension>[^.]+)$"
-        )
         if isinstance(filename, Path):
             filename = filename.name
 
-        match = re.match(pattern, filename)
-        if match is None:
+        parsed = _parse_science_filename(str(filename))
+        if parsed is None:
             raise ScienceFilePath.InvalidImapFileError(
                 f"Filename {filename} does not match expected pattern: "
                 f"{ScienceFilePath.FILENAME_CONVENTION}"
             )
 
-        components = match.groupdict()
-        components["repointing"] = None
-        components["cr"] = None
-
-        # If the repointing field exists, we want to check if it's a repointing or
-        # carrington rotation (cr) and set the field accordingly
-        interval_number = components.pop("interval")
-        if interval_number:
-            interval_number = int(interval_number)
-            # We want the repointing number as an integer
-            if components["interval_type"] == "cr":
-                components["cr"] = interval_number
-            elif components["interval_type"] == "repoint":
-                components["repointing"] = interval_number
-
-        del components["interval_type"]
-
-        return components
+        return dict(zip(_SCIENCE_COMPONENTS, parsed))
 
     @staticmethod
     def is_valid_repointing(input_repointing: str) -> bool:
@@ -414,7 +866,7 @@ class ScienceFilePath(ImapFilePath):
         bool
             Whether input repointing is valid or not.
         """
-        return re.fullmatch(r"repoint\d{5}", str(input_repointing))
+        return _is_prefixed_number(str(input_repointing), "repoint", 5)
 
     def is_valid_for_start_date(self, start_date: datetime) -> bool:
         """Check if the file is valid for the given science file start_date.
@@ -429,7 +881,7 @@ class ScienceFilePath(ImapFilePath):
         bool
             True if the file start_date is equal to the given time, False otherwise.
         """
-        if datetime.strptime(self.start_date, "%Y%m%d") == start_date:
+        if _parse_yyyymmdd(self.start_date) == start_date:
             return True
         else:
             return False
@@ -448,7 +900,7 @@ class ScienceFilePath(ImapFilePath):
         bool
             Whether input carrington rotation is valid or not.
         """
-        return re.fullmatch(r"cr\d{5}", str(input_cr))
+        return _is_prefixed_number(str(input_cr), "cr", 5)
 
 
 # Transform the suffix to the directory structure we are using
@@ -520,10 +972,47 @@ https://naif.jpl.nasa.gov/pub/naif/toolkit_docs/C/req/kernel.html
 """
 
 
+@functools.lru_cache(maxsize=8)
+def _spice_root(data_dir: str | Path) -> Path:
+    """Return the root SPICE directory within the data directory.
+
+    This is keyed on the data directory so that configuration changes are still
+    respected while the join is only done once per directory.
+
+    Parameters
+    ----------
+    data_dir : str or Path
+        The data directory from the configuration.
+
+    Returns
+    -------
+    Path
+        The SPICE directory.
+    """
+    return Path(data_dir, SPICEFilePath._dir_prefix)
+
+
+# All of the extensions matched by the SPICEFilePath patterns
+_SPICE_EXTENSIONS = (
+    ".bc",
+    ".bpc",
+    ".bsp",
+    ".csv",
+    ".mk",
+    ".sff",
+    ".tf",
+    ".tls",
+    ".tm",
+    ".tpc",
+    ".tsc",
+)
+
+
 class SPICEFilePath(ImapFilePath):
     """Class for building and validating filepaths for SPICE files."""
 
     _dir_prefix = "imap/spice"
+    __slots__ = ("_filename", "_subdir", "spice_metadata")
 
     # Covers:
     # Historical Attitude (type: ah.bc)
@@ -651,7 +1140,7 @@ class SPICEFilePath(ImapFilePath):
 
         pass
 
-    def __init__(self, filename: str | Path):
+    def __init__(self, filename: str | Path) -> None:
         """Class to store filepath and file management methods for SPICE files.
 
         If you have an instance of this class, you can be confident you have a valid
@@ -665,8 +1154,12 @@ class SPICEFilePath(ImapFilePath):
         filename : str | Path
             SPICE data filename or file path.
         """
-        self.filename = Path(filename)
-        self.spice_metadata = SPICEFilePath.extract_filename_components(self.filename)
+        self._filename = filename
+        self.spice_metadata = SPICEFilePath.extract_filename_components(
+            _basename(filename)
+        )
+        # The kernel type is fixed once parsed, so resolve its directory only once
+        self._subdir = _SPICE_DIR_MAPPING[self.spice_metadata["type"]]
 
     def construct_path(self) -> Path:
         """Construct valid path from the class variables and data_dir.
@@ -679,14 +1172,23 @@ class SPICEFilePath(ImapFilePath):
         Path
             Upload path
         """
-        spice_dir = imap_data_access.config["DATA_DIR"] / f"{self._dir_prefix}"
-        subdir = _SPICE_DIR_MAPPING[self.spice_metadata["type"]]
-        # Use the file suffix to determine the directory structure
+        # Use the file type to determine the directory structure
         # IMAP_DATA_DIR/spice/<subdir>/filename
-        return spice_dir / subdir / self.filename
+        return _spice_root(imap_data_access.config["DATA_DIR"]).joinpath(
+            self._subdir, _basename(self._filename)
+        )
+
+    @property
+    def archive_relative_path(self) -> str:
+        """Return the path of the file within the data archive.
+
+        expected return:
+        imap/spice/<subdir>/filename
+        """
+        return f"{self._dir_prefix}/{self._subdir}/{_basename(self._filename)}"
 
     @staticmethod
-    def _spice_parts_handler(components):  # noqa: PLR0912
+    def _spice_parts_handler(components: dict) -> dict:  # noqa: PLR0912
         """Validate and transform SPICE file compents.
 
         Parameters
@@ -696,9 +1198,8 @@ class SPICEFilePath(ImapFilePath):
 
         Returns
         -------
-        components : dict | None
+        components : dict
             Dictionary containing components, validated and transformed.
-            If
         """
         if components["type"] not in _SPICE_TYPE_MAPPING:
             raise SPICEFilePath.InvalidImapFileError(
@@ -713,18 +1214,14 @@ class SPICEFilePath(ImapFilePath):
         try:
             if "start_date" in components:  # Convert to datetime
                 if len(components["start_date"]) == 8:
-                    components["start_date"] = datetime.strptime(
-                        components["start_date"], "%Y%m%d"
-                    )
+                    components["start_date"] = _parse_yyyymmdd(components["start_date"])
                 else:
                     components["start_date"] = datetime.strptime(
                         components["start_date"], "%y%m%d"
                     )
             if "end_date" in components:
                 if len(components["end_date"]) == 8:
-                    components["end_date"] = datetime.strptime(
-                        components["end_date"], "%Y%m%d"
-                    )
+                    components["end_date"] = _parse_yyyymmdd(components["end_date"])
                 else:
                     components["end_date"] = datetime.strptime(
                         components["end_date"], "%y%m%d"
@@ -757,7 +1254,7 @@ class SPICEFilePath(ImapFilePath):
         return components
 
     @staticmethod
-    def extract_filename_components(filename: Path | str) -> dict | None:
+    def extract_filename_components(filename: Path | str) -> dict:
         """Extract all components from filename.
 
         Will return a dictionary in the form:
@@ -779,14 +1276,17 @@ class SPICEFilePath(ImapFilePath):
         components : dict
             Dictionary containing components.
         """
-        filename = Path(filename)
-        for regex in SPICEFilePath.valid_spice_regexes:
-            m = regex.match(filename.name)
-            if m is not None:
-                spice_metadata = SPICEFilePath._spice_parts_handler(m.groupdict())
-                # Add the extension to the metadata
-                spice_metadata["extension"] = filename.suffix[1:]
-                return spice_metadata
+        name = _basename(filename)
+        # Checking the extension first is much cheaper than running every pattern
+        # against files that can't be SPICE files
+        if name.lower().endswith(_SPICE_EXTENSIONS):
+            for regex in SPICEFilePath.valid_spice_regexes:
+                m = regex.match(name)
+                if m is not None:
+                    spice_metadata = SPICEFilePath._spice_parts_handler(m.groupdict())
+                    # Add the extension to the metadata
+                    spice_metadata["extension"] = name.rpartition(".")[2]
+                    return spice_metadata
 
         # Error if no match found to accepted types
         raise SPICEFilePath.InvalidImapFileError(
@@ -830,13 +1330,24 @@ class AncillaryFilePath(ImapFilePath):
         "pgm",
     }
     _dir_prefix = "imap/ancillary"
+    __slots__ = (
+        "_filename",
+        "descriptor",
+        "end_date",
+        "error_message",
+        "extension",
+        "instrument",
+        "mission",
+        "start_date",
+        "version",
+    )
 
     class InvalidAncillaryFileError(ImapFilePath.InvalidImapFileError):
         """DEPRECATED: Use ImapFilePath.InvalidImapFileError instead."""
 
         pass
 
-    def __init__(self, filename: str | Path):
+    def __init__(self, filename: str | Path) -> None:
         """Class to store filepath and file management methods for Ancillary files.
 
         If you have an instance of this class, you can be confident you have a valid
@@ -865,10 +1376,10 @@ class AncillaryFilePath(ImapFilePath):
         filename : str | Path
             Ancillary data filename or file path.
         """
-        self.filename = Path(filename)
+        self._filename = filename
 
         try:
-            split_filename = self.extract_filename_components(self.filename)
+            split_filename = self.extract_filename_components(_basename(filename))
         except ValueError as err:
             raise self.InvalidImapFileError(
                 f"Invalid filename. Expected file to match format: "
@@ -954,15 +1465,13 @@ class AncillaryFilePath(ImapFilePath):
         """
         error_message = ""
 
-        if any(
-            attr is None or attr == ""
-            for attr in [
-                self.mission,
-                self.instrument,
-                self.descriptor,
-                self.version,
-                self.extension,
-            ]
+        # Missing attributes are either None or empty strings
+        if not (
+            self.mission
+            and self.instrument
+            and self.descriptor
+            and self.version
+            and self.extension
         ):
             error_message = (
                 f"Invalid filename, missing attribute. Filename "
@@ -974,7 +1483,7 @@ class AncillaryFilePath(ImapFilePath):
         if self.instrument not in imap_data_access.VALID_INSTRUMENTS:
             error_message += (
                 f"Invalid instrument {self.instrument}. Please choose from "
-                f"{imap_data_access.VALID_INSTRUMENTS} \n"
+                f"{set(imap_data_access.VALID_INSTRUMENTS)} \n"
             )
 
         if self.extension not in self.VALID_EXTENSIONS:
@@ -983,11 +1492,11 @@ class AncillaryFilePath(ImapFilePath):
                 f"{self.VALID_EXTENSIONS}.\n"
             )
 
-        if not ScienceFilePath.is_valid_date(self.start_date):
+        if not _is_valid_yyyymmdd(self.start_date):
             error_message += "Invalid start date format. Please use YYYYMMDD format. \n"
 
         if self.end_date:
-            if not ScienceFilePath.is_valid_date(self.end_date):
+            if not _is_valid_yyyymmdd(self.end_date):
                 error_message += (
                     "Invalid end date format. Please use YYYYMMDD format. \n"
                 )
@@ -1007,8 +1516,26 @@ class AncillaryFilePath(ImapFilePath):
         Path
             Upload path
         """
-        upload_path = Path(f"{self._dir_prefix}/{self.instrument}/{self.filename}")
-        return imap_data_access.config["DATA_DIR"] / upload_path
+        return Path(imap_data_access.config["DATA_DIR"], *self._archive_parts())
+
+    @property
+    def archive_relative_path(self) -> str:
+        """Return the path of the file within the data archive.
+
+        expected return:
+        mission/instrument/filename
+        """
+        return "/".join(self._archive_parts())
+
+    def _archive_parts(self) -> tuple[str, ...]:
+        """Return the parts of the path of the file within the data archive.
+
+        Returns
+        -------
+        tuple of str
+            The directories and the filename, in order.
+        """
+        return (self._dir_prefix, self.instrument, _basename(self._filename))
 
     @staticmethod
     def extract_filename_components(filename: str | Path) -> dict:
@@ -1032,31 +1559,17 @@ class AncillaryFilePath(ImapFilePath):
         components : dict
             Dictionary containing components.
         """
-        # Pipe these together for optional matching in the regex below
-        extension_regex = "|".join(
-            AncillaryFilePath.VALID_EXTENSIONS.union(QuicklookFilePath.VALID_EXTENSIONS)
-        )
-        pattern = (
-            r"^(?P<mission>imap)_"
-            r"(?P<instrument>[^_]+)_"
-            r"(?P<descriptor>[^_]+)_"
-            r"(?P<start_date>\d{8})"
-            r"(_(?P<end_date>\d{8}))?"  # Optional end_date
-            r"_(?P<version>v\d{3})"
-            rf"\.(?P<extension>{extension_regex})$"
-        )
         if isinstance(filename, Path):
             filename = filename.name
 
-        match = re.match(pattern, filename)
-        if match is None:
+        parsed = _parse_ancillary_filename(str(filename))
+        if parsed is None:
             raise AncillaryFilePath.InvalidImapFileError(
                 f"Filename {filename} does not match expected pattern: "
                 f"{AncillaryFilePath.FILENAME_CONVENTION}"
             )
 
-        components = match.groupdict()
-        return components
+        return dict(zip(_ANCILLARY_COMPONENTS, parsed))
 
     def is_valid_for_start_date(self, start_date: datetime) -> bool:
         """Check if the Ancillary file is valid for the given science start_date.
@@ -1072,10 +1585,10 @@ class AncillaryFilePath(ImapFilePath):
             True if the Ancillary file date range covers the given time, False
             otherwise.
         """
-        start_date_anc = datetime.strptime(self.start_date, "%Y%m%d")
+        start_date_anc = _parse_yyyymmdd(self.start_date)
         if self.end_date:
             # If end_date is set, check to see weather the time is between start and end
-            end_date_anc = datetime.strptime(self.end_date, "%Y%m%d")
+            end_date_anc = _parse_yyyymmdd(self.end_date)
             if start_date_anc <= start_date <= end_date_anc:
                 return True
         # If end_date is not set, check to see if the time is after start_date
@@ -1089,6 +1602,7 @@ class QuicklookFilePath(ScienceFilePath):
 
     VALID_EXTENSIONS: typing.ClassVar[set[str]] = {"jpg", "pdf", "png"}
     _dir_prefix = "imap/quicklook"
+    __slots__ = ()
 
 
 class DependencyFilePath(ScienceFilePath):
@@ -1102,7 +1616,26 @@ class DependencyFilePath(ScienceFilePath):
 
     VALID_EXTENSIONS: typing.ClassVar[set[str]] = {"json"}
     _dir_prefix = "imap/dependency"
+    __slots__ = ()
 
 
 class CadenceFilePath(DependencyFilePath):
     """DEPRECATED class for CadenceFile processing, use DependencyFilePath instead."""
+
+    __slots__ = ()
+
+
+# Pipe these together for optional matching in the regex below. The quicklook
+# extensions are included, so this can only be compiled after both classes exist.
+_ancillary_extension_regex = "|".join(
+    AncillaryFilePath.VALID_EXTENSIONS.union(QuicklookFilePath.VALID_EXTENSIONS)
+)
+_ANCILLARY_RE = re.compile(
+    r"^(?P<mission>imap)_"
+    r"(?P<instrument>[^_]+)_"
+    r"(?P<descriptor>[^_]+)_"
+    r"(?P<start_date>\d{8})"
+    r"(_(?P<end_date>\d{8}))?"  # Optional end_date
+    r"_(?P<version>v\d{3})"
+    rf"\.(?P<extension>{_ancillary_extension_regex})$"
+)
@@ -1,11 +1,23 @@
 """Input/output capabilities for the IMAP data processing pipeline."""
 
-import contextlib
+import atexit
+import functools
+import hashlib
+import json
 import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Union
+from typing import Callable, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 import imap_data_access
 from imap_data_access import file_validation
@@ -17,6 +29,27 @@ from imap_data_access.file_validation import (
 
 logger = logging.getLogger(__name__)
 
+# Size of the chunks written to disk while downloading, so that large files
+# never have to be held in memory all at once
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Maximum number of files transferred at the same time by bulk_download and
+# bulk_upload
+_MAX_TRANSFER_WORKERS = 16
+
+# Query results kept in memory, keyed by the API key, query url and parameters,
+# along with the time (from time.monotonic) at which they expire. The least
+# recently used results are dropped first once there are too many.
+_QUERY_CACHE: OrderedDict[tuple, tuple[float, list[dict[str, str]]]] = OrderedDict()
+_MAX_QUERY_CACHE_ENTRIES = 128
+# Guards _QUERY_CACHE, queries can be made from several threads at once
+_QUERY_CACHE_LOCK = threading.Lock()
+# How long query results are kept if the server doesn't say otherwise, in seconds
+_DEFAULT_QUERY_CACHE_SECONDS = 60
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+_CONTENT_RANGE_START_RE = re.compile(r"bytes (\d+)-")
+# Guards the creation of the shared session
+_SESSION_LOCK = threading.Lock()
+
 
 class IMAPDataAccessError(Exception):
     """Base class for exceptions in this module."""
@@ -24,30 +57,353 @@ class IMAPDataAccessError(Exception):
     pass
 
 
-@contextlib.contextmanager
-def _make_request(request: requests.PreparedRequest):
+@functools.cache
+def _create_session() -> requests.Session:
+    """Create the session shared by all requests made from this module.
+
+    Requests failing with a temporary server error are retried. Use
+    ``_get_session`` to get the shared session instead of calling this directly.
+
+    Returns
+    -------
+    requests.Session
+        The shared session.
+    """
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        # Give the last response back so the usual error handling applies
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_maxsize=32, max_retries=retries)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    atexit.register(session.close)
+    return session
+
+
+def _get_session() -> requests.Session:
+    """Get the session shared by all requests made from this module.
+
+    The session is created on first use and then reused, so the connections to the
+    server are kept alive and pooled between requests instead of being set up again
+    for every file. Creating it is guarded by a lock, so threads asking for it at the
+    same time, like the workers of bulk_download, all get the same session.
+
+    Returns
+    -------
+    requests.Session
+        The shared session.
+    """
+    with _SESSION_LOCK:
+        return _create_session()
+
+
+def _make_request(
+    request: requests.PreparedRequest, stream: bool = False
+) -> requests.Response:
     """Get the response from a URL request using the requests library.
 
     This is a helper function to handle different types of errors that can occur
-    when making HTTP requests and yield the response body.
+    when making HTTP requests and return the response.
+
+    Parameters
+    ----------
+    request : requests.PreparedRequest
+        The request to send.
+    stream : bool, optional
+        Whether to defer downloading the response body until it is read, for
+        example with ``response.iter_content()``. Streamed responses need to be
+        closed by the caller. Defaults to False.
+
+    Returns
+    -------
+    requests.Response
+        The successful response.
     """
     logger.debug("Making request: %s", request)
-    if imap_data_access.config["API_KEY"]:
+    api_key = imap_data_access.config["API_KEY"]
+    if api_key:
         # Add the API key to the request headers if it exists
-        request.headers["x-api-key"] = imap_data_access.config["API_KEY"]
+        request.headers["x-api-key"] = api_key
 
     try:
-        with requests.Session() as session:
-            response = session.send(request)
-            response.raise_for_status()
-            yield response
+        response = _get_session().send(request, stream=stream)
+        response.raise_for_status()
     except requests.exceptions.HTTPError as e:
         # e.response.reason captures the error message from the API
         error_msg = f"{e.response.status_code} {e.response.reason}: {e.response.text}"
         raise IMAPDataAccessError(error_msg) from e
     except requests.exceptions.RequestException as e:
+        if e.response is None:
+            # The request never got a response, e.g. the server can't be reached
+            raise IMAPDataAccessError(str(e)) from e
         error_msg = f"{e.response.status_code} {e.response.reason}: {e.response.text}"
         raise IMAPDataAccessError(error_msg) from e
+    return response
+
+
+def _metadata_path(path: Path) -> Path:
+    """Get the path of the ".meta.json" file stored next to a downloaded file.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        The downloaded file.
+
+    Returns
+    -------
+    pathlib.Path
+        The path of its metadata file.
+    """
+    return path.with_name(path.name + ".meta.json")
+
+
+def _read_download_metadata(metadata_path: Path) -> dict[str, Optional[str]]:
+    """Read the metadata stored for a downloaded file.
+
+    Parameters
+    ----------
+    metadata_path : pathlib.Path
+        Path to the ".meta.json" file stored next to the downloaded file.
+
+    Returns
+    -------
+    dict
+        The stored "etag", "last_modified" and "sha256" values, or an empty
+        dictionary if nothing usable is stored.
+    """
+    try:
+        metadata = json.loads(metadata_path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(metadata, dict):
+        return {}
+    return metadata
+
+
+def _write_download_metadata(
+    metadata_path: Path, response: requests.Response, sha256: Optional[str]
+) -> None:
+    """Store the metadata of a download next to the downloaded file.
+
+    Parameters
+    ----------
+    metadata_path : pathlib.Path
+        Path to the ".meta.json" file stored next to the downloaded file.
+    response : requests.Response
+        The response the file was downloaded from.
+    sha256 : str or None
+        Hex digest of the SHA-256 hash of the downloaded file, or None if the
+        download isn't complete yet.
+    """
+    metadata = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "sha256": sha256,
+    }
+    metadata_path.write_text(json.dumps(metadata))
+
+
+def _update_hash(hasher: "hashlib._Hash", path: Path) -> None:
+    """Add the contents of a file to a hash, reading it in chunks.
+
+    Parameters
+    ----------
+    hasher : hashlib hash object
+        The hash to update.
+    path : pathlib.Path
+        The file to read.
+    """
+    with open(path, "rb") as f:
+        while chunk := f.read(_DOWNLOAD_CHUNK_SIZE):
+            hasher.update(chunk)
+
+
+def _existing_file_headers(
+    destination: Path, metadata_path: Path
+) -> Optional[dict[str, str]]:
+    """Get the request headers to download a file that already exists again.
+
+    Parameters
+    ----------
+    destination : pathlib.Path
+        The file that was already downloaded.
+    metadata_path : pathlib.Path
+        Path to the ".meta.json" file stored next to the downloaded file.
+
+    Returns
+    -------
+    dict or None
+        The conditional request headers asking the server whether the file changed,
+        an empty dictionary if the file needs to be downloaded again regardless, or
+        None if the existing file should be used without asking the server.
+    """
+    metadata = _read_download_metadata(metadata_path)
+    stored_sha256 = metadata.get("sha256")
+    if imap_data_access.config["VERIFY_HASHES"] and stored_sha256:
+        hasher = hashlib.sha256()
+        _update_hash(hasher, destination)
+        if hasher.hexdigest() != stored_sha256:
+            logger.warning(
+                "The file %s doesn't match its stored hash, downloading it again",
+                destination,
+            )
+            return {}
+
+    headers = {}
+    if metadata.get("etag"):
+        headers["If-None-Match"] = metadata["etag"]
+    if metadata.get("last_modified"):
+        headers["If-Modified-Since"] = metadata["last_modified"]
+    return headers or None
+
+
+def _resume_validator(partial_destination: Path) -> Optional[str]:
+    """Get the value of the If-Range header to continue a partial download.
+
+    Parameters
+    ----------
+    partial_destination : pathlib.Path
+        The ".part" file of the interrupted download.
+
+    Returns
+    -------
+    str or None
+        The ETag, or the Last-Modified date if there is no usable ETag, of the
+        version of the file the partial download is from. None if it isn't known,
+        in which case the download can't safely be continued.
+    """
+    metadata = _read_download_metadata(_metadata_path(partial_destination))
+    etag = metadata.get("etag")
+    # Weak ETags can't be used to ask for a range
+    if etag and not etag.startswith("W/"):
+        return etag
+    return metadata.get("last_modified")
+
+
+def _resume_from(partial_destination: Path) -> int:
+    """Get the byte an interrupted download can be continued from.
+
+    Partial files that can't safely be continued are removed.
+
+    Parameters
+    ----------
+    partial_destination : pathlib.Path
+        The ".part" file of the interrupted download.
+
+    Returns
+    -------
+    int
+        The size of the partial file, or 0 if the download has to start over.
+    """
+    if not _resume_validator(partial_destination):
+        _discard_partial_download(partial_destination)
+        return 0
+    return partial_destination.stat().st_size
+
+
+def _discard_partial_download(partial_destination: Path) -> None:
+    """Remove the ".part" file of a download along with its metadata.
+
+    Parameters
+    ----------
+    partial_destination : pathlib.Path
+        The ".part" file of the download.
+    """
+    partial_destination.unlink(missing_ok=True)
+    _metadata_path(partial_destination).unlink(missing_ok=True)
+
+
+def _write_response(
+    response: requests.Response, path: Path, append: bool = False
+) -> str:
+    """Write the body of a streamed response to a file in chunks.
+
+    The file is hashed while it is written, so it doesn't have to be read again
+    afterwards to verify it.
+
+    Parameters
+    ----------
+    response : requests.Response
+        The streamed response.
+    path : pathlib.Path
+        The file to write to.
+    append : bool, optional
+        Whether to add to the end of the existing file instead of replacing it.
+        Defaults to False.
+
+    Returns
+    -------
+    str
+        Hex digest of the SHA-256 hash of the whole file.
+    """
+    hasher = hashlib.sha256()
+    if append:
+        _update_hash(hasher, path)
+    with open(path, "ab" if append else "wb") as f:
+        for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+            f.write(chunk)
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _range_starts_at(response: requests.Response, start: int) -> bool:
+    """Check that a partial response starts at the requested byte.
+
+    Parameters
+    ----------
+    response : requests.Response
+        The response to a range request.
+    start : int
+        The first byte that was requested.
+
+    Returns
+    -------
+    bool
+        Whether the Content-Range of the response starts at the requested byte.
+    """
+    match = _CONTENT_RANGE_START_RE.match(response.headers.get("Content-Range", ""))
+    return match is not None and int(match.group(1)) == start
+
+
+def _write_download(
+    response: requests.Response,
+    destination: Path,
+    partial_destination: Path,
+    append: bool,
+) -> None:
+    """Write a downloaded file and move it into place once it is complete.
+
+    Parameters
+    ----------
+    response : requests.Response
+        The streamed response.
+    destination : pathlib.Path
+        Where the downloaded file goes.
+    partial_destination : pathlib.Path
+        The ".part" file the data is written to until it is complete.
+    append : bool
+        Whether the response continues the existing ".part" file.
+    """
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    if not append:
+        # Remember which version of the file this is, so the download can be
+        # continued if it gets interrupted
+        _write_download_metadata(_metadata_path(partial_destination), response, None)
+    sha256 = _write_response(response, partial_destination, append=append)
+    expected_sha256 = response.headers.get("X-Content-SHA256")
+    if expected_sha256 and expected_sha256.lower() != sha256:
+        _discard_partial_download(partial_destination)
+        raise IMAPDataAccessError(
+            f"The downloaded file {destination.name} is corrupted, its SHA-256 "
+            f"hash {sha256} doesn't match the expected {expected_sha256}"
+        )
+    os.replace(partial_destination, destination)
+    _metadata_path(partial_destination).unlink(missing_ok=True)
+    _write_download_metadata(_metadata_path(destination), response, sha256)
 
 
 def download(file_path: Union[Path, str]) -> Path:
@@ -62,6 +418,19 @@ def download(file_path: Union[Path, str]) -> Path:
     -------
     pathlib.Path
         Path to the downloaded file
+
+    Notes
+    -----
+    If the file already exists locally, it is only downloaded again if the server
+    reports that it changed since the last download. This relies on the ETag and
+    Last-Modified headers stored in a ".meta.json" file next to the file, so files
+    without that information are never downloaded again. If the server can't be
+    asked, the existing file is used.
+
+    The SHA-256 hash of every download is stored in the same file. It is checked
+    against the "X-Content-SHA256" header when the server provides one. If the
+    "VERIFY_HASHES" configuration is set, existing files are also checked against
+    the stored hash and downloaded again if they don't match.
     """
     # Create the proper file path object based on the extension and filename
     file_path = Path(file_path)
@@ -70,114 +439,394 @@ def download(file_path: Union[Path, str]) -> Path:
     destination = path_obj.construct_path()
 
     # Update the file_path with the full path for the download below
-    file_path = destination.relative_to(imap_data_access.config["DATA_DIR"]).as_posix()
+    file_path = path_obj.archive_relative_path
 
-    # Only download if the file doesn't already exist
-    # TODO: Do we want to verify any hashes to make sure we have the right file?
+    # Only download if the file doesn't already exist, or if it exists and we know
+    # how to ask the server whether it changed since we downloaded it
+    headers = {}
     if destination.exists():
-        logger.info("The file %s already exists, skipping download", destination)
-        return destination
+        headers = _existing_file_headers(destination, _metadata_path(destination))
+        if headers is None:
+            logger.info("The file %s already exists, skipping download", destination)
+            return destination
 
     url = f"{imap_data_access.config['DATA_ACCESS_URL']}/download/{file_path}"
     logger.info("Downloading file %s from %s to %s", file_path, url, destination)
+    try:
+        _download_to(url, destination, headers)
+    except (IMAPDataAccessError, requests.exceptions.RequestException) as e:
+        # If the existing file was only being checked for changes, it is still
+        # good to use when the server can't be asked
+        if not headers:
+            raise
+        _discard_partial_download(destination.with_name(destination.name + ".part"))
+        logger.warning(
+            "Could not check whether %s changed, using the existing file: %s",
+            destination,
+            e,
+        )
+    return destination
+
+
+def _download_to(url: str, destination: Path, headers: dict[str, str]) -> None:
+    """Download a file from a URL to its destination.
+
+    Parameters
+    ----------
+    url : str
+        The download URL.
+    destination : pathlib.Path
+        Where the downloaded file goes.
+    headers : dict
+        The conditional request headers for a file that already exists, or an empty
+        dictionary to download it regardless.
+    """
+    # The data is written to a temporary ".part" file first and only moved into
+    # place once it is complete, so an interrupted download never looks like a
+    # finished file. If a previous download of a new file was interrupted, ask the
+    # server for the remaining bytes only. The range is only sent back if the file
+    # on the server is still the version the partial file came from, otherwise the
+    # whole file is sent again.
+    partial_destination = destination.with_name(destination.name + ".part")
+    resume_from = 0
+    if not headers and partial_destination.exists():
+        resume_from = _resume_from(partial_destination)
+    if resume_from:
+        logger.info("Resuming download of %s from byte %d", url, resume_from)
+        headers = {
+            "Range": f"bytes={resume_from}-",
+            "If-Range": _resume_validator(partial_destination),
+        }
 
     # Create a request with the provided URL
-    request = requests.Request("GET", url).prepare()
-    # Open the URL and download the file
-    with _make_request(request) as response:
+    request = requests.Request("GET", url, headers=headers).prepare()
+    # Open the URL and stream the file to disk in chunks
+    try:
+        response = _make_request(request, stream=True)
+    except IMAPDataAccessError:
+        # The partial file may be the reason the request failed (e.g. a range that
+        # can't be satisfied), so start over the next time
+        if resume_from:
+            _discard_partial_download(partial_destination)
+        raise
+
+    try:
         logger.debug("Received response: %s", response)
-        # Save the file locally with the same filename
-        destination.parent.mkdir(parents=True, exist_ok=True)
-        destination.write_bytes(response.content)
+        if response.status_code == requests.codes.not_modified:
+            logger.info("The file %s is up to date, skipping download", destination)
+            return
+        # Only append if the server actually sent the requested range,
+        # otherwise it is sending the whole file again
+        resumed = resume_from and (
+            response.status_code == requests.codes.partial_content
+        )
+        if resumed and not _range_starts_at(response, resume_from):
+            # The bytes sent don't continue the partial file
+            logger.warning(
+                "The server sent the wrong range for %s, downloading it again", url
+            )
+            _discard_partial_download(partial_destination)
+            restart = True
+        else:
+            restart = False
+            _write_download(response, destination, partial_destination, resumed)
+    finally:
+        response.close()
 
+    if restart:
+        _download_to(url, destination, {})
+        return
     logger.info("File %s downloaded successfully", destination)
-    return destination
 
 
-# Too many branches (16 >12)
-# ruff: noqa: PLR0912
-def _validate_query_parameters(**kwargs) -> None:
-    """Validate all parameters used in the query function.
+def bulk_download(file_paths: Iterable[Union[Path, str]]) -> list[Path]:
+    """Download several files from the data archive at once.
 
-    This methods keyword arguments will match that of the query() parameters.
+    The downloads are independent and network bound, so they are run concurrently,
+    sharing the connections to the data archive. Each file is downloaded the same
+    way as with :func:`download`.
+
+    Parameters
+    ----------
+    file_paths : iterable of pathlib.Path or str
+        Names of the files to download, optionally including the directory paths
+
+    Returns
+    -------
+    list of pathlib.Path
+        Paths to the downloaded files, in the same order as the requested files
     """
-    table = kwargs.get("table")
-    instrument = kwargs.get("instrument")
-    data_level = kwargs.get("data_level")
-    start_date = kwargs.get("start_date")
-    end_date = kwargs.get("end_date")
-    ingestion_start_date = kwargs.get("ingestion_start_date")
-    ingestion_end_date = kwargs.get("ingestion_end_date")
-    repointing = kwargs.get("repointing")
-    version = kwargs.get("version")
-    extension = kwargs.get("extension")
+    # The archive location only depends on the filename, so requests for the same
+    # filename are only downloaded once. Downloading them at the same time would
+    # also have them write to the same temporary file.
+    filenames = [Path(file_path).name for file_path in file_paths]
+    unique_filenames = list(dict.fromkeys(filenames))
+    downloaded = dict(
+        zip(unique_filenames, _run_concurrently(download, unique_filenames))
+    )
+    return [downloaded[filename] for filename in filenames]
 
-    # Check table name
-    if table is not None and table not in imap_data_access.VALID_TABLES:
-        raise ValueError(
-            "Not a valid database table, please choose from "
-            + ", ".join(imap_data_access.VALID_TABLES)
-        )
-    # Check instrument name
-    if instrument is not None and instrument not in imap_data_access.VALID_INSTRUMENTS:
-        raise ValueError(
+
+def _run_concurrently(func: Callable, items: list) -> list:
+    """Call a function on each item using a pool of threads.
+
+    Parameters
+    ----------
+    func : callable
+        The function to call with each item.
+    items : list
+        The items to call the function with.
+
+    Returns
+    -------
+    list
+        The results of the function, in the same order as the items.
+    """
+    if not items:
+        return []
+
+    with ThreadPoolExecutor(
+        max_workers=min(_MAX_TRANSFER_WORKERS, len(items))
+    ) as executor:
+        futures = [executor.submit(func, item) for item in items]
+        try:
+            for future in as_completed(futures):
+                # Raise the first error that comes up
+                future.result()
+        except BaseException:
+            # Don't start any of the calls that are still waiting
+            for future in futures:
+                future.cancel()
+            raise
+    return [future.result() for future in futures]
+
+
+def clear_query_cache() -> None:
+    """Clear the cached query results.
+
+    Results returned by :func:`query` are reused for identical queries for a short
+    time. Call this to make sure the next queries go to the data archive.
+    """
+    with _QUERY_CACHE_LOCK:
+        _QUERY_CACHE.clear()
+
+
+def _cached_query_results(cache_key: tuple) -> Optional[list[dict[str, str]]]:
+    """Get the results of a query from the cache, if they haven't expired.
+
+    Parameters
+    ----------
+    cache_key : tuple
+        The key identifying the query.
+
+    Returns
+    -------
+    list of dict or None
+        The cached results, or None if there are none that can be used.
+    """
+    with _QUERY_CACHE_LOCK:
+        cached = _QUERY_CACHE.get(cache_key)
+        if cached is None or time.monotonic() >= cached[0]:
+            return None
+        _QUERY_CACHE.move_to_end(cache_key)
+        return cached[1]
+
+
+def _cache_query_results(
+    cache_key: tuple, cache_seconds: int, items: list[dict[str, str]]
+) -> None:
+    """Keep query results in the cache, making room for them if needed.
+
+    Expired results are dropped first, then the least recently used ones until the
+    cache is within ``_MAX_QUERY_CACHE_ENTRIES``.
+
+    Parameters
+    ----------
+    cache_key : tuple
+        The key identifying the query.
+    cache_seconds : int
+        How long the results can be reused for, in seconds.
+    items : list of dict
+        The query results.
+    """
+    with _QUERY_CACHE_LOCK:
+        now = time.monotonic()
+        expired = [key for key, (expiry, _) in _QUERY_CACHE.items() if expiry <= now]
+        for key in expired:
+            del _QUERY_CACHE[key]
+
+        _QUERY_CACHE[cache_key] = (now + cache_seconds, items)
+        _QUERY_CACHE.move_to_end(cache_key)
+        while len(_QUERY_CACHE) > _MAX_QUERY_CACHE_ENTRIES:
+            _QUERY_CACHE.popitem(last=False)
+
+
+def _query_cache_seconds(headers: dict) -> int:
+    """Get how long a query response can be cached for.
+
+    Parameters
+    ----------
+    headers : dict
+        The response headers.
+
+    Returns
+    -------
+    int
+        Number of seconds the response can be reused for, 0 if it can't be cached.
+    """
+    cache_control = headers.get("Cache-Control", "")
+    if "no-store" in cache_control or "no-cache" in cache_control:
+        return 0
+    match = _MAX_AGE_RE.search(cache_control)
+    if match is None:
+        return _DEFAULT_QUERY_CACHE_SECONDS
+    return int(match[1])
+
+
+def _is_valid_query_repointing(repointing: Union[str, int]) -> bool:
+    """Check a repointing query parameter, either 'repoint00000' or a number.
+
+    Parameters
+    ----------
+    repointing : str or int
+        The repointing to check.
+
+    Returns
+    -------
+    bool
+        Whether the repointing is valid or not.
+    """
+    if file_validation.ScienceFilePath.is_valid_repointing(repointing):
+        return True
+    try:
+        int(repointing)
+    except ValueError:
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=8)
+def _query_validators(
+    valid_tables: frozenset[str],
+    valid_instruments: frozenset[str],
+    valid_datalevels: frozenset[str],
+) -> tuple[tuple[str, Callable[[object], bool], str], ...]:
+    """Get the checks for the query parameters, in the order they are applied.
+
+    Each check is a tuple of the parameter name, a function telling whether a value
+    is valid and the error message for invalid values. The checks are cached for
+    each set of valid values, so they are rebuilt if the package level valid values
+    are changed.
+
+    Parameters
+    ----------
+    valid_tables : frozenset of str
+        The valid database tables.
+    valid_instruments : frozenset of str
+        The valid instrument names.
+    valid_datalevels : frozenset of str
+        The valid data levels.
+
+    Returns
+    -------
+    tuple
+        The parameter checks.
+    """
+    is_valid_date = file_validation.ImapFilePath.is_valid_date
+    return (
+        (
+            "table",
+            valid_tables.__contains__,
+            "Not a valid database table, please choose from " + ", ".join(valid_tables),
+        ),
+        (
+            "instrument",
+            valid_instruments.__contains__,
             "Not a valid instrument, please choose from "
-            + ", ".join(imap_data_access.VALID_INSTRUMENTS)
-        )
+            + ", ".join(valid_instruments),
+        ),
+        (
+            "data_level",
+            valid_datalevels.__contains__,
+            "Not a valid data level, choose from " + ", ".join(valid_datalevels),
+        ),
+        (
+            "start_date",
+            is_valid_date,
+            "Not a valid start date, use format 'YYYYMMDD'.",
+        ),
+        (
+            "end_date",
+            is_valid_date,
+            "Not a valid end date, use format 'YYYYMMDD'.",
+        ),
+        (
+            "ingestion_start_date",
+            is_valid_date,
+            "Not a valid ingestion start date, use format 'YYYYMMDD'.",
+        ),
+        (
+            "ingestion_end_date",
+            is_valid_date,
+            "Not a valid ingestion end date, use format 'YYYYMMDD'.",
+        ),
+        (
+            "repointing",
+            _is_valid_query_repointing,
+            "Not a valid repointing, use format repoint<num>,"
+            " where <num> is a 5 digit integer.",
+        ),
+        (
+            "version",
+            file_validation.ImapFilePath.is_valid_version,
+            "Not a valid version, use format 'vXXX'.",
+        ),
+    )
 
-    # Check data-level
-    # do an if statement that checks that data_level was passed in,
-    # then check it against all options, l0, l1a, l1b, l2, l3 etc.
-    if data_level is not None and data_level not in imap_data_access.VALID_DATALEVELS:
-        raise ValueError(
-            "Not a valid data level, choose from "
-            + ", ".join(imap_data_access.VALID_DATALEVELS)
-        )
 
-    # Check start-date
-    if start_date is not None and not file_validation.ImapFilePath.is_valid_date(
-        start_date
-    ):
-        raise ValueError("Not a valid start date, use format 'YYYYMMDD'.")
+def _latest_versions(items: list[dict[str, str]]) -> list[dict[str, str]]:
+    """Keep only the highest version of the query results for each day.
 
-    # Check end-date
-    if end_date is not None and not file_validation.ImapFilePath.is_valid_date(
-        end_date
-    ):
-        raise ValueError("Not a valid end date, use format 'YYYYMMDD'.")
+    Parameters
+    ----------
+    items : list of dict
+        The query results.
 
-    # Check ingestion-start-date
-    if (
-        ingestion_start_date is not None
-        and not file_validation.ImapFilePath.is_valid_date(ingestion_start_date)
-    ):
-        raise ValueError("Not a valid ingestion start date, use format 'YYYYMMDD'.")
+    Returns
+    -------
+    list of dict
+        The query results with the highest version for each start date.
+    """
+    # filter in a single pass, keeping the parsed version number next to the item
+    # instead of copying every item
+    latest_per_day = {}
+    for item in items:
+        day = item["start_date"]
+        version_num = int(item["version"][1:4])
+        latest = latest_per_day.get(day)
+        if latest is None or version_num > latest[0]:
+            latest_per_day[day] = (version_num, item)
+    return [item for _, item in latest_per_day.values()]
 
-    # Check ingestion-end-date
-    if (
-        ingestion_end_date is not None
-        and not file_validation.ImapFilePath.is_valid_date(ingestion_end_date)
-    ):
-        raise ValueError("Not a valid ingestion end date, use format 'YYYYMMDD'.")
 
-    if repointing is not None:
-        # check repointing follows 'repoint00000' format
-        if not file_validation.ScienceFilePath.is_valid_repointing(repointing):
-            try:
-                int(repointing)
-            except ValueError as err:
-                raise ValueError(
-                    "Not a valid repointing, use format repoint<num>,"
-                    " where <num> is a 5 digit integer."
-                ) from err
-
-    # Check version make sure to include 'latest'
-    if version is not None and not file_validation.ImapFilePath.is_valid_version(
-        version
-    ):
-        raise ValueError("Not a valid version, use format 'vXXX'.")
+def _validate_query_parameters(**kwargs) -> None:
+    """Validate all parameters used in the query function.
 
-    # check extension
+    This methods keyword arguments will match that of the query() parameters.
+    """
+    validators = _query_validators(
+        frozenset(imap_data_access.VALID_TABLES),
+        frozenset(imap_data_access.VALID_INSTRUMENTS),
+        frozenset(imap_data_access.VALID_DATALEVELS),
+    )
+    for name, is_valid, error_message in validators:
+        value = kwargs.get(name)
+        if value is not None and not is_valid(value):
+            raise ValueError(error_message)
+
+    # check extension, which depends on the table
+    table = kwargs.get("table")
+    extension = kwargs.get("extension")
     if extension is not None:
         if table == "science":
             valid_extensions = ScienceFilePath.VALID_EXTENSIONS
@@ -192,6 +841,29 @@ def _validate_query_parameters(**kwargs) -> None:
             )
 
 
+# Names of the query() and reprocess() parameters sent to the API
+_QUERY_PARAMETER_NAMES = (
+    "table",
+    "instrument",
+    "data_level",
+    "descriptor",
+    "start_date",
+    "end_date",
+    "ingestion_start_date",
+    "ingestion_end_date",
+    "repointing",
+    "version",
+    "extension",
+)
+_REPROCESS_PARAMETER_NAMES = (
+    "start_date",
+    "end_date",
+    "instrument",
+    "data_level",
+    "descriptor",
+)
+
+
 def query(
     *,
     table: Optional[str] = "science",
@@ -213,6 +885,10 @@ def query(
     query is run, if a 'latest' was passed then the query results will be
     filtered before being returned.
 
+    The results are cached in memory and reused for identical queries for as long
+    as the server allows (60 seconds by default). Use :func:`clear_query_cache` to
+    always get the latest state of the data archive.
+
     Parameters
     ----------
     table : str, optional
@@ -248,9 +924,27 @@ def query(
     list
         List of files matching the query
     """
-    # locals() gives us the keyword arguments passed to the function
-    # and allows us to filter out the None values
-    query_params = {key: value for key, value in locals().items() if value is not None}
+    # Keep only the parameters that were given, in the order of the signature
+    query_params = {
+        key: value
+        for key, value in zip(
+            _QUERY_PARAMETER_NAMES,
+            (
+                table,
+                instrument,
+                data_level,
+                descriptor,
+                start_date,
+                end_date,
+                ingestion_start_date,
+                ingestion_end_date,
+                repointing,
+                version,
+                extension,
+            ),
+        )
+        if value is not None
+    }
     logger.debug("Input query parameters: %s", query_params)
 
     # removing version from query if it is 'latest',
@@ -280,32 +974,42 @@ def query(
             query_params["repointing"] = int(repointing)
 
     url = f"{imap_data_access.config['DATA_ACCESS_URL']}/query"
-    request = requests.Request(method="GET", url=url, params=query_params).prepare()
 
-    logger.info("Querying data archive for %s with url %s", query_params, request.url)
-    with _make_request(request) as response:
+    # Reuse the results of an identical query if they haven't expired yet. Results
+    # can depend on the access rights, so queries with another API key don't share
+    # them.
+    cache_key = (
+        imap_data_access.config["API_KEY"],
+        url,
+        tuple(sorted(query_params.items())),
+    )
+    items = _cached_query_results(cache_key)
+    # Whether the results are shared with the cache
+    shared = items is not None
+    if shared:
+        logger.info("Using cached query results for %s", query_params)
+    else:
+        request = requests.Request(method="GET", url=url, params=query_params).prepare()
+
+        logger.info(
+            "Querying data archive for %s with url %s", query_params, request.url
+        )
+        response = _make_request(request)
         # Decode the JSON response as a list of items
         items = response.json()
         logger.debug("Received JSON: %s", items)
+        cache_seconds = _query_cache_seconds(response.headers)
+        if cache_seconds > 0:
+            _cache_query_results(cache_key, cache_seconds, items)
+            shared = True
 
     # if latest version was included in search then filter returned query for largest.
-    if (version == "latest") and items:
-        latest_per_day = {}
-        for item in items:
-            day = item["start_date"]
-            version_num = int(item["version"][1:4])
-            # filter by highest version per day
-            if (day not in latest_per_day) or (
-                version_num > latest_per_day[day]["_version_num"]
-            ):
-                # add extra field to identify version number
-                latest_per_day[day] = {**item, "_version_num": version_num}
-        # remove the extra field
-        items = [
-            {k: version for k, version in val.items() if k != "_version_num"}
-            for val in latest_per_day.values()
-        ]
+    if version == "latest":
+        items = _latest_versions(items)
 
+    if shared:
+        # Hand out copies so callers can't modify the cached results
+        items = [dict(item) for item in items]
     return items
 
 
@@ -338,10 +1042,14 @@ def reprocess(
     descriptor : str, optional
         Descriptor of the data product / product name (e.g. ``burst``)
     """
-    # locals() gives us the keyword arguments passed to the function
-    # and allows us to filter out the None values
+    # Keep only the parameters that were given, in the order of the signature
     reprocess_params = {
-        key: value for key, value in locals().items() if value is not None
+        key: value
+        for key, value in zip(
+            _REPROCESS_PARAMETER_NAMES,
+            (start_date, end_date, instrument, data_level, descriptor),
+        )
+        if value is not None
     }
     logger.debug("Input reprocessing parameters: %s", reprocess_params)
 
@@ -391,10 +1099,10 @@ def reprocess(
     logger.info(
         "Triggering reprocessing for %s with url %s", reprocess_params, request.url
     )
-    with _make_request(request) as response:
-        # Decode the JSON response as a list of items
-        items = response.json()
-        logger.debug("Received JSON: %s", items)
+    response = _make_request(request)
+    # Decode the JSON response as a list of items
+    items = response.json()
+    logger.debug("Received JSON: %s", items)
 
 
 def upload(file_path: Union[Path, str]) -> None:
@@ -418,19 +1126,44 @@ def upload(file_path: Union[Path, str]) -> None:
     # to upload the file to the data archive
     request = requests.Request("GET", url).prepare()
 
-    with _make_request(request) as response:
-        s3_url = response.json()
-        logger.debug("Received s3 presigned URL: %s", s3_url)
+    s3_url = _make_request(request).json()
+    logger.debug("Received s3 presigned URL: %s", s3_url)
 
-    # Follow the presigned URL to upload the file with a PUT request
-    upload_request = requests.Request(
-        "PUT", s3_url, data=file_path.read_bytes(), headers={"Content-Type": ""}
-    ).prepare()
-    with _make_request(upload_request) as response:
-        logger.debug(
-            "Received status code [%s] with response: %s",
-            response.status_code,
-            response.text,
-        )
+    # Follow the presigned URL to upload the file with a PUT request. The file is
+    # streamed from disk rather than read into memory all at once, requests sets
+    # the Content-Length from the file size.
+    with open(file_path, "rb") as f:
+        upload_request = requests.Request(
+            "PUT", s3_url, data=f, headers={"Content-Type": ""}
+        ).prepare()
+        response = _make_request(upload_request)
+    logger.debug(
+        "Received status code [%s] with response: %s",
+        response.status_code,
+        response.text,
+    )
 
     logger.info("File %s uploaded successfully", file_path)
+
+
+def bulk_upload(file_paths: Iterable[Union[Path, str]]) -> None:
+    """Upload several files to the data archive at once.
+
+    The uploads are independent and network bound, so they are run concurrently,
+    sharing the connections to the data archive. Each file is uploaded the same way
+    as with :func:`upload`.
+
+    Parameters
+    ----------
+    file_paths : iterable of pathlib.Path or str
+        Paths to the files to upload.
+    """
+    # Make sure all the files are there before uploading any of them, and only
+    # upload each file once
+    unique_paths = list(dict.fromkeys(Path(path).resolve() for path in file_paths))
+    for file_path in unique_paths:
+        if not file_path.exists():
+            raise FileNotFoundError(file_path)
+
+    _run_concurrently(upload, unique_paths)
+    logger.info("%d files uploaded successfully", len(unique_paths))
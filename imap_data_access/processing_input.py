@@ -15,7 +15,8 @@ from imap_data_access import (
     ScienceFilePath,
     SPICEFilePath,
 )
-from imap_data_access.io import download
+from imap_data_access.file_validation import _parse_yyyymmdd
+from imap_data_access.io import bulk_download
 
 
 def generate_imap_input(filename: str) -> ProcessingInput:
@@ -179,11 +180,15 @@ class ProcessingInput(ABC):
         data_type = set()
         descriptor = set()
         file_obj_list = []
+        # The path class and data type only depend on the input type, so look
+        # them up once rather than for every file
+        path_class = InputTypePathMapper[self.input_type.name].value
+        is_science = self.input_type == ProcessingInputType.SCIENCE_FILE
         for file in self.filename_list:
-            path_validator = InputTypePathMapper[self.input_type.name].value(file)
+            path_validator = path_class(file)
 
             source.add(path_validator.instrument)
-            if self.input_type == ProcessingInputType.SCIENCE_FILE:
+            if is_science:
                 data_type.add(path_validator.data_level)
             else:
                 data_type.add(self.input_type.value)
@@ -244,7 +249,7 @@ class ScienceInput(ProcessingInput):
         end_time = None
         for file in self.filename_list:
             filepath = ScienceFilePath(file)
-            date = datetime.strptime(filepath.start_date, "%Y%m%d")
+            date = _parse_yyyymmdd(filepath.start_date)
             if start_time is None or date < start_time:
                 start_time = date
             if end_time is None or date > end_time:
@@ -288,9 +293,9 @@ class AncillaryInput(ProcessingInput):
         end_time = None
         for file in self.filename_list:
             filepath = AncillaryFilePath(file)
-            startdate = datetime.strptime(filepath.start_date, "%Y%m%d")
+            startdate = _parse_yyyymmdd(filepath.start_date)
             if filepath.end_date is not None:
-                enddate = datetime.strptime(filepath.end_date, "%Y%m%d")
+                enddate = _parse_yyyymmdd(filepath.end_date)
             else:
                 enddate = startdate
 
@@ -578,11 +583,14 @@ class ProcessingInputCollection:
         source: str | None = None,
         descriptor: str | None = None,
         data_type: str | None = None,
+        unique: bool = True,
     ) -> list[Path]:
         """Get the dependency files path from the collection.
 
         Returns all file paths if no source or descriptor is provided. Otherwise,
         it returns only the files that match the source and/or descriptor.
+        Files included in several inputs are only returned once, unless unique is
+        False.
 
         Parameters
         ----------
@@ -593,6 +601,9 @@ class ProcessingInputCollection:
         data_type : str, optional
             Data type for the file. data level or ancillary or spice or spin
             or repoint.
+        unique : bool, optional
+            Whether to remove duplicate file paths, keeping the first occurrence.
+            Defaults to True.
 
         Returns
         -------
@@ -607,14 +618,16 @@ class ProcessingInputCollection:
                 file.construct_path() for file in processing_input.imap_file_paths
             )
 
+        if unique:
+            # dict keys keep the insertion order
+            out = list(dict.fromkeys(out))
         return out
 
     def download_all_files(self):
         """Download all the dependencies for the processing input."""
         # Go through science or ancillary or SPICE dependencies
         # processing input list and download all files
-        for path in self.get_file_paths():
-            download(path)
+        bulk_download(self.get_file_paths())
 
     def get_valid_inputs_for_start_date(
         self, start_date: datetime, return_latest_ancillary: bool = False
@@ -651,7 +664,7 @@ class ProcessingInputCollection:
                 # Get the latest file for each ProcessingInput
                 valid_filepaths = sorted(
                     valid_filepaths,
-                    key=lambda x: datetime.strptime(x.start_date, "%Y%m%d"),
+                    key=lambda x: _parse_yyyymmdd(x.start_date),
                     reverse=True,
                 )[0:1]
             # Create a new ProcessingInput from the valid filepaths and add it to the
@@ -201,9 +201,8 @@ def get_packet_times_ert(
     # Returns a text file with the packet times
     # 2024-12-01T00:00:00
     # 2024-12-01T00:00:01
-    with _make_request(request) as response:
-        data = response.text.split("\n")
-        logger.debug("Received data: %s", data)
+    data = _make_request(request).text.split("\n")
+    logger.debug("Received data: %s", data)
 
     # Iterate over each line in the response, converting them to dates.
     # We first strip the line to remove any whitespace (\r) and skip any trailing lines
@@ -256,8 +255,7 @@ def get_packet_binary_data_sctime(
         "GET", query_range, headers=headers, params=params
     ).prepare()
 
-    with _make_request(request) as response:
-        return response.content
+    return _make_request(request).content
 
 
 def download_daily_data(
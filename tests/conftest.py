@@ -5,6 +5,7 @@ from unittest.mock import patch
 import pytest
 
 import imap_data_access
+from imap_data_access.io import _create_session, clear_query_cache
 
 
 @pytest.fixture(autouse=True)
@@ -17,6 +18,15 @@ def _set_global_config(monkeypatch: pytest.fixture, tmp_path: pytest.fixture):
     # Make sure we don't leak any of this content if a user has set them locally
     monkeypatch.setitem(imap_data_access.config, "API_KEY", "test_key")
     monkeypatch.setitem(imap_data_access.config, "WEBPODA_TOKEN", "test_token")
+    monkeypatch.setitem(imap_data_access.config, "VERIFY_HASHES", False)
+
+
+@pytest.fixture(autouse=True)
+def _clear_query_cache():
+    """Make sure query results aren't shared between tests."""
+    clear_query_cache()
+    yield
+    clear_query_cache()
 
 
 @pytest.fixture(autouse=True)
@@ -28,10 +38,18 @@ def mock_send_request():
     mock_send_request : unittest.mock.MagicMock
         Mock object for ``session.send()``
     """
+    # The session is shared between requests, so make sure a mocked one gets created
+    # for every test and doesn't outlive it
+    _create_session.cache_clear()
     with patch("requests.Session") as mock_session:
-        mock_session_instance = mock_session.return_value.__enter__.return_value
+        mock_session_instance = mock_session.return_value
         mock_session_instance.send.return_value.content = b"Mock file content"
+        mock_session_instance.send.return_value.headers = {}
+        mock_session_instance.send.return_value.iter_content.return_value = [
+            b"Mock file content"
+        ]
         yield mock_session_instance.send
+    _create_session.cache_clear()
 
 
 @pytest.fixture
@@ -13,6 +13,9 @@ from imap_data_access.file_validation import (
     QuicklookFilePath,
     ScienceFilePath,
     SPICEFilePath,
+    _parse_yyyymmdd,
+    generate_imap_file_path,
+    parse_science_batch,
 )
 
 
@@ -65,10 +68,73 @@ def test_extract_filename_components():
     )
 
 
+@pytest.mark.parametrize(
+    ("filename", "expected_cls"),
+    [
+        ("imap_mag_l1a_burst_20210101_v001.cdf", ScienceFilePath),
+        ("imap_mag_l0_raw_20210101-repoint00001_v001.pkts", ScienceFilePath),
+        ("imap_mag_test_20210101_20210102_v001.csv", AncillaryFilePath),
+        ("imap_mag_test_20210101_v001.cdf", AncillaryFilePath),
+        ("imap_mag_l1a_test_20210101_v001.png", QuicklookFilePath),
+        ("imap_mag_l1a_test_20210101_v001.json", DependencyFilePath),
+        # Also a valid dependency filename, ancillary files take precedence
+        ("imap_mag_l1a_20210101_20210102_v001.json", AncillaryFilePath),
+        ("imap_1000_100_1000_100_01.ap.bc", SPICEFilePath),
+        ("naif0012.tls", SPICEFilePath),
+    ],
+)
+def test_generate_imap_file_path(filename, expected_cls):
+    """Tests that ``generate_imap_file_path`` picks the right class."""
+    file_path = generate_imap_file_path(filename)
+    assert type(file_path) is expected_cls
+
+
+def test_generate_imap_file_path_invalid():
+    """Tests that ``generate_imap_file_path`` rejects unknown files."""
+    with pytest.raises(ValueError, match="Invalid file type"):
+        generate_imap_file_path("test.txt")
+
+
+def test_parse_science_batch():
+    """Tests that ``parse_science_batch`` returns aligned component columns."""
+    filenames = [
+        "imap_mag_l1a_burst_20210101_v001.pkts",
+        Path("imap/swe/l1b/2022/02/imap_swe_l1b_sci_20220201-repoint00012_v002.cdf"),
+        "not_a_science_file.txt",
+        "imap_codice_l2_hi_20240101-cr02290_v003.cdf",
+    ]
+    columns = parse_science_batch(filenames)
+
+    assert set(columns) == {
+        "mission",
+        "instrument",
+        "data_level",
+        "descriptor",
+        "start_date",
+        "repointing",
+        "cr",
+        "version",
+        "extension",
+    }
+    assert all(len(column) == len(filenames) for column in columns.values())
+    assert columns["instrument"] == ["mag", "swe", None, "codice"]
+    assert columns["start_date"] == ["20210101", "20220201", None, "20240101"]
+    assert columns["repointing"] == [None, 12, None, None]
+    assert columns["cr"] == [None, None, None, 2290]
+    assert columns["extension"] == ["pkts", "cdf", None, "cdf"]
+
+    # Matches what the single file parser returns
+    expected = ScienceFilePath.extract_filename_components(filenames[1])
+    assert {key: values[1] for key, values in columns.items()} == expected
+
+    assert all(column == [] for column in parse_science_batch([]).values())
+
+
 def test_construct_sciencefilepathmanager():
     """Tests that the ``ScienceFilePath`` class constructs a valid filename."""
     valid_filename = "imap_mag_l1a_burst_20210101_v001.cdf"
     sfm = ScienceFilePath(valid_filename)
+    assert sfm.filename == Path(valid_filename)
     assert sfm.mission == "imap"
     assert sfm.instrument == "mag"
     assert sfm.data_level == "l1a"
@@ -102,6 +168,7 @@ def test_construct_sciencefilepathmanager():
     valid_filepath = Path("/test/imap_mag_l1a_burst_20210101_v001.cdf")
     sfm = ScienceFilePath(valid_filepath)
 
+    assert sfm.filename == valid_filepath
     assert sfm.instrument == "mag"
     assert sfm.data_level == "l1a"
     assert sfm.descriptor == "burst"
@@ -114,6 +181,27 @@ def test_construct_sciencefilepathmanager():
     assert sfm.is_valid_for_start_date(datetime(2021, 1, 1))
     assert not sfm.is_valid_for_start_date(datetime(2021, 1, 3))
 
+    # Changed attributes are checked when validating again
+    sfm.instrument = "notaninstrument"
+    assert "Invalid instrument notaninstrument" in sfm.validate_filename()
+    sfm.instrument = "mag"
+    assert sfm.validate_filename() == ""
+
+    # The filename can still be assigned to
+    sfm.filename = "imap_mag_l1a_burst_20210102_v001.cdf"
+    assert sfm.filename == Path("imap_mag_l1a_burst_20210102_v001.cdf")
+
+
+def test_science_file_path_valid_values_changed(monkeypatch):
+    """Test that changing the valid values is picked up after first use."""
+    valid_filename = "imap_mag_l1a_burst_20210101_v001.cdf"
+    ScienceFilePath(valid_filename)
+
+    monkeypatch.setattr(imap_data_access, "VALID_INSTRUMENTS", frozenset({"swe"}))
+    with pytest.raises(ScienceFilePath.InvalidImapFileError):
+        ScienceFilePath(valid_filename)
+    ScienceFilePath("imap_swe_l1a_burst_20210101_v001.cdf")
+
 
 def test_is_valid_date():
     """Tests the ``is_valid_date`` method."""
@@ -129,6 +217,48 @@ def test_is_valid_date():
     invalid_date = "2021010"
     assert not ScienceFilePath.is_valid_date(invalid_date)
 
+    # Leap years
+    assert ScienceFilePath.is_valid_date("20240229")
+    assert ScienceFilePath.is_valid_date("20000229")
+    assert not ScienceFilePath.is_valid_date("20210229")
+    assert not ScienceFilePath.is_valid_date("21000229")
+
+    invalid_date = "20211301"
+    assert not ScienceFilePath.is_valid_date(invalid_date)
+
+
+@pytest.mark.parametrize("date", ["20210101", "20240229", "19991231"])
+def test_parse_yyyymmdd(date):
+    """Tests that ``_parse_yyyymmdd`` matches ``strptime``."""
+    assert _parse_yyyymmdd(date) == datetime.strptime(date, "%Y%m%d")
+
+
+@pytest.mark.parametrize(
+    "date", ["2021-01-01", "20210132", "2021010", "20210229", "00000101", "+2021011"]
+)
+def test_parse_yyyymmdd_invalid(date):
+    """Tests that ``_parse_yyyymmdd`` rejects invalid dates."""
+    with pytest.raises(ValueError, match="format|out of range"):
+        _parse_yyyymmdd(date)
+
+
+def test_is_valid_version_repointing_cr():
+    """Tests the ``is_valid_version``, ``is_valid_repointing`` and ``is_valid_cr``."""
+    assert ImapFilePath.is_valid_version("v001")
+    assert ImapFilePath.is_valid_version("latest")
+    assert not ImapFilePath.is_valid_version("v01")
+    assert not ImapFilePath.is_valid_version("v0001")
+    assert not ImapFilePath.is_valid_version("x001")
+
+    assert ScienceFilePath.is_valid_repointing("repoint00001")
+    assert not ScienceFilePath.is_valid_repointing("repoint0001")
+    assert not ScienceFilePath.is_valid_repointing("repoint0000a")
+    assert not ScienceFilePath.is_valid_repointing(1)
+
+    assert ScienceFilePath.is_valid_cr("cr00023")
+    assert not ScienceFilePath.is_valid_cr("cr023")
+    assert not ScienceFilePath.is_valid_cr(23)
+
 
 def test_construct_upload_path():
     """Tests the ``construct_path`` method."""
@@ -140,6 +270,10 @@ def test_construct_upload_path():
 
     assert sfm.construct_path() == expected_output
 
+    # Only the filename is used, not any directories it was given with
+    sfm = ScienceFilePath(Path("/test") / valid_filename)
+    assert sfm.construct_path() == expected_output
+
 
 def test_generate_from_inputs():
     """Tests the ``generate_from_inputs`` method."""
@@ -192,6 +326,21 @@ def test_generate_from_inputs():
             "glows", "l3a", "test", "20210101", "v001", cr=23, repointing=1
         )
 
+    sfm = ScienceFilePath.generate_from_inputs(
+        "mag", "l1a", "test", "20210101", "v001", repointing="repoint00002"
+    )
+    assert sfm.repointing == 2
+    assert sfm.cr is None
+    assert sfm.filename == Path("imap_mag_l1a_test_20210101-repoint00002_v001.cdf")
+
+    # The generated filename still has to follow the filename convention
+    with pytest.raises(ImapFilePath.InvalidImapFileError):
+        ScienceFilePath.generate_from_inputs("mag", "l1a", "a_b", "20210101", "v001")
+    with pytest.raises(ImapFilePath.InvalidImapFileError):
+        ScienceFilePath.generate_from_inputs(
+            "mag", "l1a", "test", "20210101", "v001", repointing=123456
+        )
+
 
 def test_spice_file_path():
     """Tests the ``SPICEFilePath`` class."""
@@ -557,6 +706,52 @@ def test_science_file_creation_data_dir(monkeypatch):
     assert science_file.construct_path().is_relative_to(new_data_dir_location)
 
 
+@pytest.mark.parametrize(
+    "file_path",
+    [
+        AncillaryFilePath("imap_mag_test_20210101_v001.cdf"),
+        SPICEFilePath("imap_1000_100_1000_100_01.ap.bc"),
+    ],
+)
+def test_file_creation_data_dir(monkeypatch, file_path):
+    # DATA_DIR is looked up when the path is constructed rather than cached,
+    # so changes to the configuration are always respected
+    new_data_dir_location = Path("/new/path/to/data")
+    monkeypatch.setitem(
+        imap_data_access.config,
+        "DATA_DIR",
+        new_data_dir_location,
+    )
+    assert file_path.construct_path().is_relative_to(new_data_dir_location)
+
+
+@pytest.mark.parametrize(
+    ("file_path", "expected"),
+    [
+        (
+            ScienceFilePath("dir/imap_mag_l1a_burst_20210101_v001.cdf"),
+            "imap/mag/l1a/2021/01/imap_mag_l1a_burst_20210101_v001.cdf",
+        ),
+        (
+            AncillaryFilePath("imap_mag_test_20210101_v001.cdf"),
+            "imap/ancillary/mag/imap_mag_test_20210101_v001.cdf",
+        ),
+        (
+            SPICEFilePath("imap_1000_100_1000_100_01.ap.bc"),
+            "imap/spice/ck/imap_1000_100_1000_100_01.ap.bc",
+        ),
+        (
+            QuicklookFilePath("imap_mag_l1a_burst_20210101_v001.png"),
+            "imap/quicklook/mag/l1a/2021/01/imap_mag_l1a_burst_20210101_v001.png",
+        ),
+    ],
+)
+def test_archive_relative_path(file_path, expected):
+    assert file_path.archive_relative_path == expected
+    # Matches the full path relative to the data directory
+    assert file_path.construct_path() == imap_data_access.config["DATA_DIR"] / expected
+
+
 def test_quicklook_file_path():
     """Tests the ``QuicklookFilePath`` class for different scenarios."""
 
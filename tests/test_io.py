@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import hashlib
+import inspect
+import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import DEFAULT, MagicMock
 
 import pytest
 import requests
 
 import imap_data_access
-from imap_data_access.io import _make_request
+from imap_data_access.io import _get_session, _make_request
 
 test_science_filename = "imap_swe_l1_test-description_20100101_v000.cdf"
 test_science_path = "imap/swe/l1/2010/01/" + test_science_filename
@@ -33,9 +37,43 @@ def test_redirect(mock_send_request):
 
     request = MagicMock()
     request.url = "http://test-example.com"
-    with _make_request(request) as response:
-        assert mock_send_request.call_count == 1
-        assert response.status_code == 307
+    response = _make_request(request)
+    assert mock_send_request.call_count == 1
+    assert response.status_code == 307
+
+
+def test_session_reused(mock_send_request):
+    """Test that all requests go through a single pooled session.
+
+    Parameters
+    ----------
+    mock_send_request : unittest.mock.MagicMock
+        Mock object for requests.Session
+    """
+    session = _get_session()
+    # The adapter with connection pooling and retries is mounted for both schemes
+    mounted = [call.args[0] for call in session.mount.call_args_list]
+    assert mounted == ["http://", "https://"]
+
+    request = MagicMock()
+    for _ in range(3):
+        _make_request(request)
+    assert _get_session() is session
+    assert mock_send_request.call_count == 3
+
+
+def test_session_created_once_across_threads(mock_send_request):
+    """Test that threads asking for the session at the same time share one.
+
+    Parameters
+    ----------
+    mock_send_request : unittest.mock.MagicMock
+        Mock object for requests.Session
+    """
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        sessions = list(executor.map(lambda _: _get_session(), range(64)))
+    assert all(session is sessions[0] for session in sessions)
+    assert requests.Session.call_count == 1
 
 
 def test_request_errors(mock_send_request):
@@ -69,6 +107,15 @@ def test_request_errors(mock_send_request):
     ):
         imap_data_access.download(test_science_path)
 
+    # Errors without any response, e.g. the server can't be reached
+    mock_send_request.side_effect = requests.exceptions.ConnectionError(
+        "Connection refused"
+    )
+    with pytest.raises(
+        imap_data_access.io.IMAPDataAccessError, match="Connection refused"
+    ):
+        imap_data_access.download(test_science_path)
+
 
 @pytest.mark.parametrize(
     ("file_path", "destination"),
@@ -113,6 +160,8 @@ def test_download(mock_send_request, file_path: str | Path, destination: str):
     # Mock the response to return binary content
     mock_response = MagicMock()
     mock_response.content = b"Mock file content"
+    mock_response.iter_content.return_value = [b"Mock file ", b"content"]
+    mock_response.headers = {}
     mock_response.status_code = 200
     mock_send_request.return_value = mock_response
 
@@ -127,9 +176,12 @@ def test_download(mock_send_request, file_path: str | Path, destination: str):
 
     # Assert that the file content matches the mock data
     assert result.read_bytes() == b"Mock file content"
+    # The temporary partial file should have been moved into place
+    assert not result.with_name(result.name + ".part").exists()
 
-    # Should have only been one call to send
+    # Should have only been one streamed call to send
     mock_send_request.assert_called_once()
+    assert mock_send_request.call_args.kwargs["stream"] is True
 
     # Assert that the correct URL was used for the download
     sent_request = mock_send_request.call_args[0][0]
@@ -158,6 +210,278 @@ def test_download_already_exists(mock_send_request):
     assert mock_send_request.call_count == 0
 
 
+def test_bulk_download(mock_send_request):
+    """Test that several files can be downloaded at once.
+
+    Parameters
+    ----------
+    mock_send_request : unittest.mock.MagicMock
+        Mock object for requests.Session
+    """
+    file_paths = [
+        test_science_filename,
+        "imap_mag_test_20210101_v001.csv",
+        "imap_1000_100_1000_100_01.ap.bc",
+    ]
+    results = imap_data_access.bulk_download(file_paths)
+    data_dir = imap_data_access.config["DATA_DIR"]
+    assert results == [
+        data_dir / test_science_path,
+        data_dir / "imap/ancillary/mag/imap_mag_test_20210101_v001.csv",
+        data_dir / "imap/spice/ck/imap_1000_100_1000_100_01.ap.bc",
+    ]
+    assert all(result.read_bytes() == b"Mock file content" for result in results)
+    assert mock_send_request.call_count == 3
+
+    # The same file requested several times is only downloaded once
+    for result in results:
+        result.unlink()
+    mock_send_request.reset_mock()
+    results = imap_data_access.bulk_download(
+        [test_science_path, test_science_filename, Path(test_science_path)]
+    )
+    assert results == [data_dir / test_science_path] * 3
+    assert mock_send_request.call_count == 1
+
+    assert imap_data_access.bulk_download([]) == []
+
+
+def test_download_resume(mock_send_request):
+    """Test that an interrupted download continues where it stopped.
+
+    Parameters
+    ----------
+    mock_send_request : unittest.mock.MagicMock
+        Mock object for requests.Session
+    """
+    destination = imap_data_access.config["DATA_DIR"] / test_science_path
+    partial_destination = destination.with_name(destination.name + ".part")
+    partial_metadata = partial_destination.with_name(
+        partial_destination.name + ".meta.json"
+    )
+
+    # The download gets interrupted, leaving the partial file and the version of
+    # the file it came from
+    def interrupted_content(chunk_size):
+        yield b"Mock file "
+        raise requests.exceptions.ConnectionError("Connection lost")
+
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.iter_content.side_effect = interrupted_content
+    mock_response.headers = {"ETag": '"abc"'}
+    mock_send_request.return_value = mock_response
+    with pytest.raises(requests.exceptions.ConnectionError):
+        imap_data_access.download(test_science_path)
+    assert partial_destination.read_bytes() == b"Mock file "
+    assert json.loads(partial_metadata.read_text())["etag"] == '"abc"'
+
+    mock_response.status_code = 206
+    mock_response.iter_content.side_effect = None
+    mock_response.iter_content.return_value = [b"content"]
+    mock_response.headers = {"ETag": '"abc"', "Content-Range": "bytes 10-16/17"}
+    result = imap_data_access.download(test_science_path)
+    request_headers = mock_send_request.call_args[0][0].headers
+    assert request_headers["Range"] == "bytes=10-"
+    # The range is only sent if the file didn't change in the meantime
+    assert request_headers["If-Range"] == '"abc"'
+    assert result.read_bytes() == b"Mock file content"
+    assert not partial_destination.exists()
+    assert not partial_metadata.exists()
+
+    # A range the server can't satisfy removes the partial file
+    result.unlink()
+    partial_destination.write_bytes(b"Mock file content and more")
+    partial_metadata.write_text(json.dumps({"etag": '"abc"'}))
+    error_response = MagicMock()
+    error_response.status_code = 416
+    error_response.reason = "Range Not Satisfiable"
+    error_response.text = ""
+    mock_send_request.side_effect = requests.exceptions.HTTPError(
+        response=error_response
+    )
+    with pytest.raises(imap_data_access.io.IMAPDataAccessError, match="416"):
+        imap_data_access.download(test_science_path)
+    assert not partial_destination.exists()
+    assert not partial_metadata.exists()
+
+
+def test_download_resume_stale_partial(mock_send_request):
+    """Test that a partial file isn't continued with a different version of the file.
+
+    Parameters
+    ----------
+    mock_send_request : unittest.mock.MagicMock
+        Mock object for requests.Session
+    """
+    destination = imap_data_access.config["DATA_DIR"] / test_science_path
+    partial_destination = destination.with_name(destination.name + ".part")
+    partial_metadata = partial_destination.with_name(
+        partial_destination.name + ".meta.json"
+    )
+    partial_destination.parent.mkdir(parents=True)
+    partial_destination.write_bytes(b"OLDOLD")
+    partial_metadata.write_text(json.dumps({"etag": '"old"'}))
+    mock_response = MagicMock()
+    mock_send_request.return_value = mock_response
+
+    # The file changed on the server, so it sends the whole file again
+    mock_response.status_code = 200
+    mock_response.iter_content.return_value = [b"NEWNEW"]
+    mock_response.headers = {"ETag": '"new"'}
+    imap_data_access.download(test_science_path)
+    assert mock_send_request.call_args[0][0].headers["If-Range"] == '"old"'
+    assert destination.read_bytes() == b"NEWNEW"
+
+    # A range that doesn't continue the partial file starts the download over
+    destination.unlink()
+    partial_destination.write_bytes(b"Mock file ")
+    partial_metadata.write_text(json.dumps({"etag": '"abc"'}))
+    wrong_range_response = MagicMock()
+    wrong_range_response.status_code = 206
+    wrong_range_response.iter_content.return_value = [b"file content"]
+    wrong_range_response.headers = {"Content-Range": "bytes 5-16/17"}
+    mock_response.iter_content.return_value = [b"Mock file content"]
+    mock_send_request.side_effect = [wrong_range_response, mock_response]
+    imap_data_access.download(test_science_path)
+    assert "Range" not in mock_send_request.call_args[0][0].headers
+    assert destination.read_bytes() == b"Mock file content"
+    mock_send_request.side_effect = None
+
+    # Without knowing where the partial file came from, it isn't continued
+    destination.unlink()
+    partial_destination.write_bytes(b"OLDOLD")
+    imap_data_access.download(test_science_path)
+    assert "Range" not in mock_send_request.call_args[0][0].headers
+    assert destination.read_bytes() == b"Mock file content"
+
+
+def test_download_conditional(mock_send_request):
+    """Test that existing files are only downloaded again when they changed.
+
+    Parameters
+    ----------
+    mock_send_request : unittest.mock.MagicMock
+        Mock object for requests.Session
+    """
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.iter_content.return_value = [b"Mock file content"]
+    mock_response.headers = {
+        "ETag": '"abc123"',
+        "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT",
+    }
+    mock_send_request.return_value = mock_response
+
+    result = imap_data_access.download(test_science_path)
+    metadata_path = result.with_name(result.name + ".meta.json")
+    assert metadata_path.exists()
+    # The first request isn't conditional
+    sent_request = mock_send_request.call_args[0][0]
+    assert "If-None-Match" not in sent_request.headers
+
+    # The server says the file didn't change
+    mock_response.status_code = 304
+    mock_response.iter_content.return_value = []
+    assert imap_data_access.download(test_science_path) == result
+    assert mock_send_request.call_count == 2
+    sent_request = mock_send_request.call_args[0][0]
+    assert sent_request.headers["If-None-Match"] == '"abc123"'
+    assert sent_request.headers["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+    assert result.read_bytes() == b"Mock file content"
+
+    # The file changed on the server and no validators came back this time
+    mock_response.status_code = 200
+    mock_response.iter_content.return_value = [b"New file content"]
+    mock_response.headers = {}
+    imap_data_access.download(test_science_path)
+    assert mock_send_request.call_count == 3
+    assert result.read_bytes() == b"New file content"
+    metadata = json.loads(metadata_path.read_text())
+    assert metadata["etag"] is None
+    assert metadata["last_modified"] is None
+
+    # Without any validators the existing file is used as is
+    imap_data_access.download(test_science_path)
+    assert mock_send_request.call_count == 3
+
+
+def test_download_conditional_unreachable(mock_send_request):
+    """Test that an existing file is used when the server can't be asked about it.
+
+    Parameters
+    ----------
+    mock_send_request : unittest.mock.MagicMock
+        Mock object for requests.Session
+    """
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.iter_content.return_value = [b"Mock file content"]
+    mock_response.headers = {"ETag": '"abc123"'}
+    mock_send_request.return_value = mock_response
+    result = imap_data_access.download(test_science_path)
+
+    mock_send_request.side_effect = requests.exceptions.ConnectionError(
+        "Connection refused"
+    )
+    assert imap_data_access.download(test_science_path) == result
+    assert mock_send_request.call_count == 2
+    assert result.read_bytes() == b"Mock file content"
+
+    # The connection drops while the changed file is being downloaded
+    def interrupted_content(chunk_size):
+        yield b"New "
+        raise requests.exceptions.ConnectionError("Connection lost")
+
+    mock_send_request.side_effect = None
+    mock_response.iter_content.side_effect = interrupted_content
+    assert imap_data_access.download(test_science_path) == result
+    assert result.read_bytes() == b"Mock file content"
+    assert not result.with_name(result.name + ".part").exists()
+
+
+def test_download_hash(mock_send_request, monkeypatch):
+    """Test that downloads are hashed and checked against the expected hash.
+
+    Parameters
+    ----------
+    mock_send_request : unittest.mock.MagicMock
+        Mock object for requests.Session
+    monkeypatch : pytest.MonkeyPatch
+        Pytest fixture to change the configuration
+    """
+    expected_sha256 = hashlib.sha256(b"Mock file content").hexdigest()
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.iter_content.return_value = [b"Mock file ", b"content"]
+    mock_response.headers = {"X-Content-SHA256": expected_sha256.upper()}
+    mock_send_request.return_value = mock_response
+
+    result = imap_data_access.download(test_science_path)
+    metadata_path = result.with_name(result.name + ".meta.json")
+    assert json.loads(metadata_path.read_text())["sha256"] == expected_sha256
+
+    # Existing files are only checked against the stored hash when requested
+    result.write_bytes(b"Corrupted content")
+    imap_data_access.download(test_science_path)
+    assert mock_send_request.call_count == 1
+    monkeypatch.setitem(imap_data_access.config, "VERIFY_HASHES", True)
+    imap_data_access.download(test_science_path)
+    assert mock_send_request.call_count == 2
+    assert result.read_bytes() == b"Mock file content"
+    # The restored file matches, so there's no need to download it again
+    imap_data_access.download(test_science_path)
+    assert mock_send_request.call_count == 2
+
+    # A download that doesn't match the hash sent by the server is rejected
+    result.unlink()
+    mock_response.headers = {"X-Content-SHA256": "0" * 64}
+    with pytest.raises(imap_data_access.io.IMAPDataAccessError, match="corrupted"):
+        imap_data_access.download(test_science_path)
+    assert not result.exists()
+    assert not result.with_name(result.name + ".part").exists()
+
+
 @pytest.mark.parametrize(
     "query_params",
     [
@@ -193,6 +517,7 @@ def test_query(mock_send_request, query_params: dict):
     """
     mock_response = MagicMock()
     mock_response.json.return_value = []
+    mock_response.headers = {}
     mock_send_request.return_value = mock_response
 
     response = imap_data_access.query(**query_params)
@@ -220,6 +545,175 @@ def test_query(mock_send_request, query_params: dict):
     assert called_url == expected_url_encoded
 
 
+def test_query_cache(mock_send_request):
+    """Test that identical queries reuse the cached results until they expire.
+
+    Parameters
+    ----------
+    mock_send_request : unittest.mock.MagicMock
+        Mock object for requests.Session
+    """
+    mock_response = MagicMock()
+    mock_response.json.return_value = [
+        {"start_date": "20100101", "version": "v001"},
+        {"start_date": "20100101", "version": "v002"},
+    ]
+    mock_response.headers = {"Cache-Control": "public, max-age=300"}
+    mock_send_request.return_value = mock_response
+
+    first = imap_data_access.query(instrument="swe")
+    # Modifying the results doesn't affect the cache
+    first[0]["version"] = "v999"
+    second = imap_data_access.query(instrument="swe")
+    assert mock_send_request.call_count == 1
+    assert second == mock_response.json.return_value
+    # 'latest' is filtered from the same cached results
+    latest = imap_data_access.query(instrument="swe", version="latest")
+    assert mock_send_request.call_count == 1
+    assert latest == [{"start_date": "20100101", "version": "v002"}]
+
+    # Different parameters are a different query
+    imap_data_access.query(instrument="mag")
+    assert mock_send_request.call_count == 2
+
+    imap_data_access.clear_query_cache()
+    imap_data_access.query(instrument="swe")
+    assert mock_send_request.call_count == 3
+
+    # Responses the server doesn't want cached are always requested again
+    imap_data_access.clear_query_cache()
+    mock_response.headers = {"Cache-Control": "no-cache"}
+    imap_data_access.query(instrument="swe")
+    imap_data_access.query(instrument="swe")
+    assert mock_send_request.call_count == 5
+
+
+def test_query_cache_eviction(mock_send_request, monkeypatch):
+    """Test that the query cache drops expired and least recently used results.
+
+    Parameters
+    ----------
+    mock_send_request : unittest.mock.MagicMock
+        Mock object for requests.Session
+    monkeypatch : pytest.MonkeyPatch
+        Fixture used to shrink the cache and control the clock
+    """
+    mock_response = MagicMock()
+    mock_response.json.return_value = []
+    mock_response.headers = {"Cache-Control": "max-age=10"}
+    mock_send_request.return_value = mock_response
+    monkeypatch.setattr(imap_data_access.io, "_MAX_QUERY_CACHE_ENTRIES", 2)
+    now = 1000.0
+    monkeypatch.setattr(imap_data_access.io.time, "monotonic", lambda: now)
+
+    imap_data_access.query(instrument="swe")
+    imap_data_access.query(instrument="mag")
+    # Using the swe results makes mag the least recently used
+    imap_data_access.query(instrument="swe")
+    imap_data_access.query(instrument="hit")
+    assert mock_send_request.call_count == 3
+    assert len(imap_data_access.io._QUERY_CACHE) == 2
+    imap_data_access.query(instrument="swe")
+    assert mock_send_request.call_count == 3
+    imap_data_access.query(instrument="mag")
+    assert mock_send_request.call_count == 4
+
+    # Expired results are dropped when new ones come in
+    now += 20
+    imap_data_access.query(instrument="idex")
+    assert len(imap_data_access.io._QUERY_CACHE) == 1
+
+    # Changing the API key doesn't reuse results fetched with the previous key
+    monkeypatch.setitem(imap_data_access.config, "API_KEY", "another-key")
+    imap_data_access.query(instrument="idex")
+    assert mock_send_request.call_count == 6
+
+
+def test_query_cache_threads(mock_send_request, monkeypatch):
+    """Test that queries from several threads can share the cache.
+
+    Parameters
+    ----------
+    mock_send_request : unittest.mock.MagicMock
+        Mock object for requests.Session
+    monkeypatch : pytest.MonkeyPatch
+        Fixture used to shrink the cache
+    """
+    mock_response = MagicMock()
+    mock_response.json.return_value = [{"start_date": "20100101", "version": "v001"}]
+    mock_response.headers = {"Cache-Control": "max-age=300"}
+    mock_send_request.return_value = mock_response
+    # A small cache, so results are evicted while other threads use them
+    monkeypatch.setattr(imap_data_access.io, "_MAX_QUERY_CACHE_ENTRIES", 2)
+    instruments = ["swe", "mag", "hit", "idex"] * 100
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(
+            executor.map(
+                lambda instrument: imap_data_access.query(instrument=instrument),
+                instruments,
+            )
+        )
+    assert all(result == mock_response.json.return_value for result in results)
+    assert len(imap_data_access.io._QUERY_CACHE) <= 2
+
+
+def test_query_uncached_results_not_copied(mock_send_request):
+    """Test that results which aren't cached are handed out as they came in.
+
+    Parameters
+    ----------
+    mock_send_request : unittest.mock.MagicMock
+        Mock object for requests.Session
+    """
+    mock_response = MagicMock()
+    mock_response.json.return_value = [{"start_date": "20100101", "version": "v001"}]
+    mock_response.headers = {"Cache-Control": "no-store"}
+    mock_send_request.return_value = mock_response
+
+    result = imap_data_access.query(instrument="swe")
+    assert result[0] is mock_response.json.return_value[0]
+
+
+def test_query_latest(mock_send_request):
+    """Test that 'latest' keeps only the highest version for each day.
+
+    Parameters
+    ----------
+    mock_send_request : unittest.mock.MagicMock
+        Mock object for requests.Session
+    """
+    mock_response = MagicMock()
+    mock_response.json.return_value = [
+        {"start_date": "20100101", "version": "v001"},
+        {"start_date": "20100102", "version": "v003"},
+        {"start_date": "20100101", "version": "v002"},
+        {"start_date": "20100102", "version": "v001"},
+    ]
+    mock_response.headers = {}
+    mock_send_request.return_value = mock_response
+
+    items = imap_data_access.query(instrument="swe", version="latest")
+    assert items == [
+        {"start_date": "20100101", "version": "v002"},
+        {"start_date": "20100102", "version": "v003"},
+    ]
+    # The version isn't sent with the query
+    assert "version" not in mock_send_request.call_args[0][0].url
+
+
+def test_query_parameter_names():
+    """Test that the parameter names sent to the API match the signatures."""
+    assert (
+        tuple(inspect.signature(imap_data_access.query).parameters)
+        == imap_data_access.io._QUERY_PARAMETER_NAMES
+    )
+    assert (
+        tuple(inspect.signature(imap_data_access.reprocess).parameters)
+        == imap_data_access.io._REPROCESS_PARAMETER_NAMES
+    )
+
+
 def test_query_no_params(mock_send_request):
     """Test a call to the Query API that has no parameters.
     Parameters
@@ -246,6 +740,15 @@ def test_query_bad_params(mock_send_request):
     assert mock_send_request.call_count == 0
 
 
+def test_query_valid_values_changed(mock_send_request, monkeypatch):
+    """Test that changing the valid values is picked up after first use."""
+    imap_data_access.query(instrument="mag")
+
+    monkeypatch.setattr(imap_data_access, "VALID_INSTRUMENTS", frozenset({"swe"}))
+    with pytest.raises(ValueError, match="Not a valid instrument"):
+        imap_data_access.query(instrument="mag")
+
+
 @pytest.mark.parametrize(
     ("query_flag", "query_input", "expected_output"),
     [
@@ -356,6 +859,16 @@ def test_upload(
     file_to_upload.parent.mkdir(parents=True, exist_ok=True)
     file_to_upload.write_bytes(b"test file content")
 
+    # The file is streamed, so read the body while it is being sent
+    sent_bodies = []
+
+    def read_body(request, **kwargs):
+        body = request.body
+        sent_bodies.append(body.read() if hasattr(body, "read") else body)
+        return DEFAULT
+
+    mock_send_request.side_effect = read_body
+
     os.chdir(imap_data_access.config["DATA_DIR"])
     imap_data_access.upload(upload_file_path)
 
@@ -389,7 +902,43 @@ def test_upload(
     assert request_sent.method == "PUT"
 
     # Assert that the original data from the test file was sent
-    assert request_sent.body == b"test file content"
+    assert sent_bodies[1] == b"test file content"
+    assert request_sent.headers["Content-Length"] == str(len(b"test file content"))
+
+
+def test_bulk_upload(mock_send_request):
+    """Test uploading several files at once."""
+    mock_send_request.return_value.json.return_value = "https://s3-test-bucket.com"
+    file_paths = []
+    for i in range(3):
+        file_path = imap_data_access.config["DATA_DIR"] / f"test-file-{i}.txt"
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(b"test file content")
+        file_paths.append(file_path)
+
+    # Repeated files are only uploaded once
+    imap_data_access.bulk_upload([*file_paths, str(file_paths[0])])
+
+    # Two requests per file, one for the upload url and one for the upload itself
+    assert mock_send_request.call_count == 6
+    requests_sent = [call.args[0] for call in mock_send_request.call_args_list]
+    upload_urls = sorted(
+        request.url for request in requests_sent if request.method == "GET"
+    )
+    assert upload_urls == [
+        f"https://api.test.com/upload/test-file-{i}.txt" for i in range(3)
+    ]
+
+
+def test_bulk_upload_no_file(mock_send_request):
+    """Test that nothing is uploaded if one of the files is missing."""
+    file_path = imap_data_access.config["DATA_DIR"] / "test-file.txt"
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_bytes(b"test file content")
+
+    with pytest.raises(FileNotFoundError):
+        imap_data_access.bulk_upload([file_path, "missing-file.txt"])
+    assert mock_send_request.call_count == 0
 
 
 @pytest.mark.parametrize(
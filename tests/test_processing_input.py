@@ -1,7 +1,9 @@
 import json
 from datetime import datetime
+from unittest.mock import MagicMock
 
 import pytest
+import requests
 
 from imap_data_access import (
     AncillaryFilePath,
@@ -9,6 +11,7 @@ from imap_data_access import (
     SPICEFilePath,
     processing_input,
 )
+from imap_data_access.io import IMAPDataAccessError
 from imap_data_access.processing_input import (
     AncillaryInput,
     ProcessingInput,
@@ -397,6 +400,29 @@ def test_get_file_paths():
     all_files = input_collection.get_file_paths()
     assert len(all_files) == 4
 
+    # Inputs added to the list directly are found as well
+    input_collection.processing_input.append(
+        AncillaryInput("imap_mag_l1b-cal_20240312_v000.cdf")
+    )
+    assert len(input_collection.get_file_paths("mag")) == 3
+    input_collection.processing_input = input_collection.processing_input[:3]
+    assert len(input_collection.get_file_paths("mag")) == 2
+    assert input_collection.get_processing_inputs(source="swe") == []
+
+    # Inputs replaced in the list, keeping its length, are found by their new source
+    mag_input = input_collection.get_processing_inputs(source="mag")[0]
+    index = input_collection.processing_input.index(mag_input)
+    hit_input = ScienceInput("imap_hit_l1a_sci_20240312_v000.cdf")
+    input_collection.processing_input[index] = hit_input
+    assert mag_input not in input_collection.get_processing_inputs(source="mag")
+    assert hit_input in input_collection.get_processing_inputs(source="hit")
+    input_collection.processing_input[index] = mag_input
+
+    # The same file in several inputs is only returned once by default
+    input_collection.add(ScienceInput("imap_hit_l1b_sci_20240312_v000.cdf"))
+    assert input_collection.get_file_paths() == all_files
+    assert len(input_collection.get_file_paths(unique=False)) == 5
+
 
 def test_get_file_paths_descriptor():
     # Example where we have 2 ultra 45 sensor files, 1 ultra 90 sensor file.
@@ -513,6 +539,27 @@ def test_download_all_files():
         assert file.exists()
 
 
+def test_download_all_files_error(mock_send_request):
+    mock_response = MagicMock()
+    mock_response.status_code = 404
+    mock_response.reason = "Not Found"
+    mock_response.text = "The requested resource was not found."
+    mock_send_request.side_effect = requests.exceptions.HTTPError(
+        response=mock_response
+    )
+    input_collection = processing_input.ProcessingInputCollection(
+        ScienceInput(
+            "imap_hit_l1b_sci_20240312_v000.cdf", "imap_hit_l1b_sci_20240313_v000.cdf"
+        ),
+        AncillaryInput("imap_hit_l1b-cal_20240312_v000.cdf"),
+    )
+    with pytest.raises(IMAPDataAccessError, match="404 Not Found"):
+        input_collection.download_all_files()
+
+    # Nothing to download
+    processing_input.ProcessingInputCollection().download_all_files()
+
+
 def test_get_valid_inputs_for_start_date():
     mag_sci_anc = ScienceInput(
         "imap_mag_l1a_norm-magi_20250101_v000.cdf",